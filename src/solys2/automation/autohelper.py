@@ -3,24 +3,44 @@
 Module that contains the functionalities that are used for performing automatic actions
 with the Solys2.
 
+It exports the following classes:
+    * MoveStatus : Enum that represents the result of a read_and_move call.
+    * AutomationWorker : Abstract class of the objects that perform automatic processes \
+in a thread.
+    * LoggerCloser : Object that closes the logger handlers of an automatic process once \
+it has been stopped and its thread has ended.
+
 It exports the following functions:
     * get_body_calculator : Obtain the BodyCalculator object corresponding to the given \
 parameters.
+    * prepare_solys : Configure a connected Solys2 for an automatic process and obtain the \
+BodyCalculator for it.
+    * is_sun_library : Check if the given library is a solar library.
     * check_time_solys : Check the solys internal time against the computer time and log \
 an info or warning message if necessary.
     * wait_position_reached : Waits until the solys is approx. pointing at the given position.
     * read_and_move : Reads some information from the solys and writes it down to the logger.
 Then it moves it to a position using the given position function and parameters.
+    * sleep_unless_stopped : Sleep the given seconds, waking up earlier if the process is \
+stopped.
+    * worker_thread_name : Obtain a unique name for the thread of an automatic process.
     * exception_tracking : When an execution fails and must end a set of actions must be \
 taken in order to communicate it and synchronize it.
 """
 
 """___Built-In Modules___"""
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from enum import Enum
+import itertools
+from typing import Dict, Tuple, Union
 import time
 import datetime
 import logging
+import math
+import socket
+from threading import Lock
+from typing import Callable
+import weakref
 
 """___Third-Party Modules___"""
 # import here
@@ -45,8 +65,108 @@ __maintainer__ = "Javier Gatón Herguedas"
 __email__ = "gaton@goa.uva.es"
 __status__ = "Development"
 
+_POLL_MIN_SECS = 0.05
+_POLL_MAX_SECS = 1
+# Degrees of difference between the expected and actual positions considered as reached
+_POS_TOLERANCE = 0.01
+_POS_TOLERANCE_SQ = _POS_TOLERANCE * _POS_TOLERANCE
+# Seconds without getting closer to the position after which the Solys2 is considered stuck
+_STALL_SECS = 30
+# Fraction of the fastest possible movement time that is waited before the first position
+# poll. The measured speeds are lower than the real ones because of the polling delays.
+_FIRST_POLL_MARGIN = 0.5
+# Degrees of difference between the target and current positions below which no movement
+# is sent, as the Solys2 wouldn't move
+MIN_MOVE_DEGREES = 0.001
+_ZERO_TD = datetime.timedelta(0)
+_UTC = datetime.timezone.utc
+_TIME_CHECK_SECS = 3600
+# time.monotonic() of the last time check of each Solys2
+_last_time_checks: "weakref.WeakKeyDictionary[solys2.Solys2, float]" = weakref.WeakKeyDictionary()
+# Fastest speed observed for each Solys2, in degrees per second
+_solys_speeds: "weakref.WeakKeyDictionary[solys2.Solys2, float]" = weakref.WeakKeyDictionary()
+
+# Seconds during which the location of a Solys2 is reused instead of asking for it again
+_LOCATION_CACHE_SECS = 3600
+# (ip, port) of each Solys2 -> (time.monotonic() when it was obtained, latitude, longitude)
+_location_cache: Dict[Tuple[str, int], Tuple[float, float, float]] = {}
+
+# Unique suffix for the names of the worker threads
+_thread_seq = itertools.count()
+
+# The library enums are MoonLibrary, SunLibrary or _BodyLibrary, so they are compared by value.
+_SUN_LIB_VALUES = frozenset(l.value for l in psc.SunLibrary)
+
+class MoveStatus(Enum):
+    """
+    Enum that represents the result of a read_and_move call.
+
+    OK: The Solys2 moved to the position.
+    TRANSIENT: The Solys2 returned an error or didn't answer in time. The movement can be tried
+    again later.
+    FATAL: The connection with the Solys2 was lost and it couldn't be re-established.
+    """
+    OK = 0
+    TRANSIENT = 1
+    FATAL = 2
+
+def _utcnow() -> datetime.datetime:
+    """Current UTC timezone-aware datetime."""
+    return datetime.datetime.now(_UTC)
+
+def is_sun_library(library: psc._BodyLibrary) -> bool:
+    """
+    Check if the given library is a solar library.
+
+    Parameters
+    ----------
+    library : _BodyLibrary
+        Body library, it can also be a MoonLibrary or a SunLibrary.
+
+    Returns
+    -------
+    is_sun : bool
+        True if the library calculates the solar position.
+    """
+    return library.value in _SUN_LIB_VALUES
+
+def _get_location(solys: solys2.Solys2, logger: logging.Logger) -> Tuple[float, float]:
+    """
+    Obtain the location of the Solys2. It's reused for _LOCATION_CACHE_SECS seconds for
+    the Solys2 with the same ip and port, as it doesn't change.
+
+    Parameters
+    ----------
+    solys : solys2.Solys2
+        Solys2 which location is wanted.
+    logger : logging.Logger
+        Logger that will log out the log messages
+
+    Returns
+    -------
+    lat : float
+        Latitude of the Solys2.
+    lon : float
+        Longitude of the Solys2.
+    """
+    key = (solys.ip, solys.port)
+    cached = _location_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _LOCATION_CACHE_SECS:
+        logger.debug("Using the previously obtained coordinates.")
+        return cached[1], cached[2]
+    lat, lon, _, ll_com = solys.get_location_pressure()
+    if ll_com.out != response.OutCode.ANSWERED:
+        if ll_com.err != None:
+            logger.error("ERROR obtaining coordinates: %s", solys2.translate_error(ll_com.err))
+        else:
+            logger.error("ERROR obtaining coordinates. Unknown error.")
+    else:
+        _location_cache[key] = (time.monotonic(), lat, lon)
+    return lat, lon
+
 def get_body_calculator(solys: solys2.Solys2, library: psc._BodyLibrary, logger: logging.Logger,
-    altitude: float = 0, kernels_path: str = "./kernels") -> psc.BodyCalculator:
+    altitude: float = 0, kernels_path: str = "./kernels",
+    interp_seconds: float = 0) -> psc.BodyCalculator:
     """
     Obtain the BodyCalculator corresponding to the given parameters.
 
@@ -63,43 +183,66 @@ def get_body_calculator(solys: solys2.Solys2, library: psc._BodyLibrary, logger:
     kernels_path : str
         Directory where the needed SPICE kernels are stored. Used only if SPICE library
         is selected.
+    interp_seconds : float
+        If greater than 0, the calculator will be wrapped in an InterpolatedBodyCalculator
+        with a grid of this many seconds. By default 0 (exact positions).
 
     Returns
     -------
     calc : BodyCalculator
         Calculator that will be able to calculate the position of the body for a given date.
     """
-    lat, lon, _, ll_com = solys.get_location_pressure()
-    if ll_com.out != response.OutCode.ANSWERED:
-        if ll_com.err != None:
-            logger.error("ERROR obtaining coordinates: {}".format(solys2.translate_error(ll_com.err)))
-        else:
-            logger.error("ERROR obtaining coordinates. Unknown error.")
-    logger.debug("Latitude: {:.4f}. Longitude: {:.4f}".format(lat, lon))
-    switcher: Dict[int, psc.BodyCalculator] = {
-        psc._BodyLibrary.EPHEM_MOON.value: psc.EphemMoonCalc,
-        psc._BodyLibrary.SPICEDMOON.value: psc.SpiceMoonCalc,
-        psc._BodyLibrary.SPICEDMOONSAFE.value: psc.SpiceMoonCalc,
-        psc._BodyLibrary.PYLUNAR.value: psc.PylunarMoonCalc,
-        psc._BodyLibrary.PYSOLAR.value: psc.PysolarSunCalc,
-        psc._BodyLibrary.EPHEM_SUN.value: psc.EphemSunCalc,
-        psc._BodyLibrary.SPICEDSUN.value: psc.SpiceSunCalc,
-        psc._BodyLibrary.SPICEDSUNSAFE.value: psc.SpiceSunCalc
-    }
-    body_calc_class = switcher[library.value]
-    logger.debug("Using {} library.".format(library.name))
-    if library.value == psc._BodyLibrary.SPICEDMOON.value or \
-        library.value == psc._BodyLibrary.SPICEDSUN.value or \
-        library.value == psc._BodyLibrary.SPICEDMOONSAFE.value or \
-        library.value == psc._BodyLibrary.SPICEDSUNSAFE.value:
+    lat, lon = _get_location(solys, logger)
+    logger.debug("Latitude: %.4f. Longitude: %.4f", lat, lon)
+    body_lib = psc._BodyLibrary(library.value)
+    logger.debug("Using %s library.", library.name)
+    if body_lib.needs_kernels:
         logger.debug("Using SPICE.")
-        retry = False
-        if library.value == psc._BodyLibrary.SPICEDMOONSAFE.value or \
-            library.value == psc._BodyLibrary.SPICEDSUNSAFE.value:
+        if body_lib.retry_nospice:
             logger.debug("SPICE SAFE")
-            retry = True
-        return body_calc_class(lat, lon, altitude, kernels_path, retry, logger)
-    return body_calc_class(lat, lon)
+        body_calc = body_lib.calc_class(lat, lon, altitude, kernels_path, body_lib.retry_nospice,
+            logger)
+    else:
+        body_calc = body_lib.calc_class(lat, lon)
+    if interp_seconds > 0:
+        logger.debug("Interpolating positions every %s seconds.", interp_seconds)
+        body_calc = psc.InterpolatedBodyCalculator(body_calc, interp_seconds)
+    return body_calc
+
+def prepare_solys(solys: solys2.Solys2, library: psc._BodyLibrary, logger: logging.Logger,
+    altitude: float = 0, kernels_path: str = "./kernels",
+    interp_seconds: float = 0) -> psc.BodyCalculator:
+    """
+    Configure a connected Solys2 for an automatic process and obtain the BodyCalculator for it.
+    It disables the power save, obtains the calculator and checks the Solys2 time.
+
+    Parameters
+    ----------
+    solys : solys2.Solys2
+        Solys2 that will perform the automatic process.
+    library : _BodyLibrary
+        Body library that will be used to track the body. Moon or Sun.
+    logger : logging.Logger
+        Logger that will log out the log messages
+    altitude : float
+        Altitude in meters of the observer point. Used only if SPICE library is selected.
+    kernels_path : str
+        Directory where the needed SPICE kernels are stored. Used only if SPICE library
+        is selected.
+    interp_seconds : float
+        If greater than 0, the calculator will be wrapped in an InterpolatedBodyCalculator
+        with a grid of this many seconds. By default 0 (exact positions).
+
+    Returns
+    -------
+    calc : BodyCalculator
+        Calculator that will be able to calculate the position of the body for a given date.
+    """
+    solys.set_power_save(False)
+    body_calc = get_body_calculator(solys, library, logger, altitude, kernels_path,
+        interp_seconds)
+    check_time_solys(solys, logger)
+    return body_calc
 
 def check_time_solys(solys: solys2.Solys2, logger: logging.Logger):
     """
@@ -113,16 +256,22 @@ def check_time_solys(solys: solys2.Solys2, logger: logging.Logger):
     logger : logging.Logger
         Logger that will log out the log messages.
     """
+    _last_time_checks[solys] = time.monotonic()
     td, _ = solys.calculate_timedelta()
     secs = td.total_seconds()
     if abs(secs) <= _common.MAX_SECS_DIFF_WARN:
-        logger.info("Solys clock vs PC clock: {} seconds.".format(secs))
+        logger.info("Solys clock vs PC clock: %s seconds.", secs)
     else:
-        logger.warning("Solys clock vs PC clock: {} seconds.".format(secs))
+        logger.warning("Solys clock vs PC clock: %s seconds.", secs)
 
-def wait_position_reached(solys: solys2.Solys2, az: float, ze: float, logger: logging.Logger):
+def wait_position_reached(solys: solys2.Solys2, az: float, ze: float,
+    logger: logging.Logger, distance: float = None) -> bool:
     """
-    Waits until the solys is approx. pointing at the given position.
+    Waits until the solys is approx. pointing at the given position, or until it stops
+    getting closer to it for _STALL_SECS seconds.
+
+    If the distance of the movement is given, the first poll of the position is delayed
+    according to the fastest speed observed for that Solys2, as it can't arrive before.
 
     Parameters
     ----------
@@ -134,21 +283,68 @@ def wait_position_reached(solys: solys2.Solys2, az: float, ze: float, logger: lo
         Zenith of the position.
     logger : logging.Logger
         Logger that will log out the log messages.
+    distance : float
+        Degrees that the Solys2 has to move in the axis with the largest movement. By default
+        None, the position is polled from the start.
+
+    Returns
+    -------
+    reached : bool
+        True if the position was reached, False if the Solys2 stopped getting closer to it.
     """
+    t_start = time.monotonic()
+    speed = _solys_speeds.get(solys)
+    if distance is not None and speed is not None:
+        first_wait = _FIRST_POLL_MARGIN * distance / speed
+        logger.debug("Waiting %.2f seconds before polling the position.", first_wait)
+        time.sleep(first_wait)
+    # The polling delay starts small and doubles until it reaches _POLL_MAX_SECS, so short
+    # movements are detected quickly without polling too often during long ones.
+    delay = _POLL_MIN_SECS
+    last_dif = None
+    # Squared distance below which the Solys2 counts as getting closer: the closest distance
+    # so far minus the tolerance
+    progress_sq = math.inf
+    last_progress = time.monotonic()
     while True:
         # get_queue_status is not that reliable
         prev_az, prev_ze, _ = solys.get_current_position()
-        pos_dif = abs(az - prev_az) +  abs(ze - prev_ze)
-        if pos_dif <= 0.01:
-            break
-        logger.debug("Position difference too large: {:.4f}. (Expected vs Actual)".format(pos_dif))
-        logger.debug("Azimuth {:.4f} vs {:.4f}. Zenith: {:.4f} vs {:.4f}.".format(az, prev_az,
-            ze, prev_ze))
-        logger.debug("Sleeping 1 second...")
-        time.sleep(1)
+        # Squared euclidean distance, compared against the squared tolerance
+        d_az = az - prev_az
+        d_ze = ze - prev_ze
+        pos_dif_sq = d_az * d_az + d_ze * d_ze
+        if pos_dif_sq <= _POS_TOLERANCE_SQ:
+            elapsed = time.monotonic() - t_start
+            if distance is not None and elapsed > 0:
+                _solys_speeds[solys] = max(distance / elapsed, speed or 0)
+            return True
+        now = time.monotonic()
+        if pos_dif_sq < progress_sq:
+            # The distance is above the tolerance, so the difference is positive
+            progress_dist = math.sqrt(pos_dif_sq) - _POS_TOLERANCE
+            progress_sq = progress_dist * progress_dist
+            last_progress = now
+        elif now - last_progress >= _STALL_SECS:
+            logger.warning("The Solys2 hasn't got closer to the position in %s seconds. \
+Distance: %.4f. Azimuth %.4f vs %.4f. Zenith: %.4f vs %.4f.", _STALL_SECS,
+                math.sqrt(pos_dif_sq), az, prev_az, ze, prev_ze)
+            return False
+        if last_dif is not None and pos_dif_sq > last_dif:
+            # Moving away (overshoot), start polling often again
+            delay = _POLL_MIN_SECS
+        last_dif = pos_dif_sq
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Position difference too large: %.4f. (Expected vs Actual)",
+                math.sqrt(pos_dif_sq))
+            logger.debug("Azimuth %.4f vs %.4f. Zenith: %.4f vs %.4f.", az, prev_az,
+                ze, prev_ze)
+            logger.debug("Sleeping %.2f seconds...", delay)
+        time.sleep(delay)
+        delay = min(delay * 2, _POLL_MAX_SECS)
 
 def read_and_move(solys: solys2.Solys2, body_calc: psc.BodyCalculator, logger: logging.Logger,
-    offset: Tuple[float, float] = (0,0), datetime_offset: float = 0):
+    offset: Tuple[float, float] = (0,0),
+    datetime_offset: Union[float, datetime.timedelta] = _ZERO_TD) -> MoveStatus:
     """
     Reads some information from the solys and writes it down to the logger.
     Then it moves it to a position using the given position function and parameters.
@@ -164,42 +360,115 @@ def read_and_move(solys: solys2.Solys2, body_calc: psc.BodyCalculator, logger: l
     offset : tuple of 2 floats.
         It will move to the calculated position + some optional offset in degrees.
         (azimuth_offset, zenith_offset). By default (0,0).
-    datetime_offset : float
+    datetime_offset : float or datetime.timedelta
         Offset of seconds that the body positions will be calculated, added to currrent time.
+        Callers that move repeatedly with the same offset can pass it as a timedelta.
+
+    Returns
+    -------
+    status : MoveStatus
+        OK if it moved, TRANSIENT if the Solys2 returned an error or timed out and FATAL if the
+        connection was lost.
     """
-    dt = datetime.datetime.now(datetime.timezone.utc)
-    logger.info("UTC Datetime: {}.".format(dt))
-    should_check_time_solys = (dt.minute == 0 )
+    dt = _utcnow()
+    logger.info("UTC Datetime: %s.", dt)
+    # The time is checked every hour
+    last_check = _last_time_checks.get(solys)
+    should_check_time_solys = last_check is None or \
+        time.monotonic() - last_check >= _TIME_CHECK_SECS
     try:
-        prev_az, prev_ze, _ = solys.get_current_position()
-        logger.info("Current Position: Azimuth: {:.4f}, Zenith: {:.4f}.".format(prev_az, prev_ze))
-        az_adj, ze_adj, _ = solys.adjust()
-        logger.debug("Adjustment of {:.4f} and {:.4f}.".format(az_adj, ze_adj))
-        dt = datetime.datetime.now(datetime.timezone.utc)
-        if should_check_time_solys:
-            logger.debug("Checking computer time against Solys internal time.")
-            check_time_solys(solys, logger)
-        logger.info("Real UTC Datetime: {}".format(dt))
-        dt = dt + datetime.timedelta(0, datetime_offset)
-        logger.info("Position UTC Datetime: {}".format(dt))
+        (prev_az, prev_ze, _), (az_adj, ze_adj, _) = solys.get_position_and_adjustment()
+        logger.info("Current Position: Azimuth: %.4f, Zenith: %.4f.", prev_az, prev_ze)
+        logger.debug("Adjustment of %.4f and %.4f.", az_adj, ze_adj)
+        dt = _utcnow()
+        logger.info("Real UTC Datetime: %s", dt)
+        if not isinstance(datetime_offset, datetime.timedelta):
+            datetime_offset = datetime.timedelta(seconds=datetime_offset)
+        dt = dt + datetime_offset
+        logger.info("Position UTC Datetime: %s", dt)
         az, ze = body_calc.get_position(dt)
         new_az = min(360, az + offset[0])
         new_ze = min(90, ze + offset[1])
-        solys.set_azimuth(new_az)
-        solys.set_zenith(new_ze)
-        logger.info("Sent positions:")
-        logger.info("Azimuth: {:.4f} + {:.4f} = ({:.4f}).".format(az, offset[0], new_az))
-        logger.info("Zenith: {:.4f} + {:.4f} = ({:.4f}).\n".format(ze, offset[1], new_ze))
-        wait_position_reached(solys, new_az+az_adj, new_ze+ze_adj, logger)
-        dt = datetime.datetime.now(datetime.timezone.utc)
-        logger.info("Finished moving at UTC datetime: {}.".format(dt))
+        d_az = new_az + az_adj - prev_az
+        d_ze = new_ze + ze_adj - prev_ze
+        if d_az * d_az + d_ze * d_ze < MIN_MOVE_DEGREES * MIN_MOVE_DEGREES:
+            logger.info("Already at Azimuth: %.4f, Zenith: %.4f. Not moving.", new_az, new_ze)
+        else:
+            solys.set_position(new_az, new_ze)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Sent positions:")
+                logger.info("Azimuth: %.4f + %.4f = (%.4f).", az, offset[0], new_az)
+                logger.info("Zenith: %.4f + %.4f = (%.4f).\n", ze, offset[1], new_ze)
+            if not wait_position_reached(solys, new_az+az_adj, new_ze+ze_adj, logger,
+                max(abs(d_az), abs(d_ze))):
+                return MoveStatus.TRANSIENT
+            dt = _utcnow()
+            logger.info("Finished moving at UTC datetime: %s.", dt)
+        if should_check_time_solys:
+            # Checked after moving, so it doesn't delay the movement
+            logger.debug("Checking computer time against Solys internal time.")
+            check_time_solys(solys, logger)
+        return MoveStatus.OK
     except solys2.SolysException as e:
-        dt = datetime.datetime.now(datetime.timezone.utc)
-        logger.error("Error at UTC datetime: {}".format(dt))
-        logger.error("Error: {}".format(e))
+        dt = _utcnow()
+        logger.error("Error at UTC datetime: %s", dt)
+        logger.error("Error: %s", e)
+        return MoveStatus.TRANSIENT
+    except (socket.timeout, TimeoutError) as e:
+        # The Solys2 didn't answer in time, but the connection might still be usable
+        dt = _utcnow()
+        logger.error("Timeout at UTC datetime: %s", dt)
+        logger.error("Error: %s", e)
+        return MoveStatus.TRANSIENT
+    except OSError as e:
+        dt = _utcnow()
+        logger.error("Connection error at UTC datetime: %s", dt)
+        logger.error("Error: %s", e)
+        return MoveStatus.FATAL
+
+def sleep_unless_stopped(seconds: float, cont_track: _common.ContainedBool = None) -> bool:
+    """
+    Sleep the given seconds. If cont_track is a StopSignal the sleep ends as soon as it's
+    set to False.
+
+    Parameters
+    ----------
+    seconds : float
+        Amount of seconds that will be slept at most.
+    cont_track : ContainedBool or StopSignal
+        Container for the boolean value that represents if the process must stop or if it should
+        continue. If None the sleep can't be interrupted.
+
+    Returns
+    -------
+    stopped : bool
+        True if the process must stop.
+    """
+    if isinstance(cont_track, _common.StopSignal):
+        return cont_track.wait(max(0, seconds))
+    if seconds > 0:
+        time.sleep(seconds)
+    return cont_track is not None and not cont_track.value
+
+def worker_thread_name(kind: str) -> str:
+    """
+    Obtain a unique name for the thread of an automatic process, so it can be identified
+    in debuggers and profilers.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of automatic process, like "track", "cross" or "mesh".
+
+    Returns
+    -------
+    name : str
+        Thread name, "solys2-<kind>-<number>".
+    """
+    return "solys2-{}-{}".format(kind, next(_thread_seq))
 
 def exception_tracking(logger: logging.Logger, e: Exception, solys: solys2.Solys2,
-    is_finished: _common.ContainedBool):
+    is_finished: _common.ContainedBool, close_solys: bool = True):
     """
     When an execution fails and must end a set of actions must be taken in order
     to communicate it and synchronize it.
@@ -215,14 +484,18 @@ def exception_tracking(logger: logging.Logger, e: Exception, solys: solys2.Solys
     is_finished :
         Container for the boolean value that initially was False, but it should be changed
         to True when exiting the function.
+    close_solys : bool
+        If True the connection is closed. It should be False if the solys was given by the user.
+        By default True.
     """
     logger.error("Stopped tracking body.")
-    logger.error(str(e))
-    try:
-        solys.close()
-    except Exception as eclose:
-        logger.error("Error closing connection.")
-        logger.error(str(eclose))
+    logger.error("%s", e)
+    if close_solys and solys is not None:
+        try:
+            solys.close()
+        except Exception as eclose:
+            logger.error("Error closing connection.")
+            logger.error("%s", eclose)
     if is_finished:
         is_finished.value = True
 
@@ -241,3 +514,73 @@ class AutomationWorker(ABC):
     def is_finished(self) -> bool:
         """Check if the thread has successfully finished executing."""
         pass
+
+    @abstractmethod
+    def wait_finished(self, timeout: float = None) -> bool:
+        """Wait until the thread has successfully finished executing, or the timeout expires."""
+        pass
+
+class LoggerCloser:
+    """
+    Object that closes the handlers of the logger of an automatic process once the process
+    has been stopped and its thread has ended, whichever happens last, so the last messages
+    of the thread are logged.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        Logger whose handlers will be closed.
+    """
+    def __init__(self, logger: logging.Logger):
+        """
+        Parameters
+        ----------
+        logger : logging.Logger
+            Logger whose handlers will be closed.
+        """
+        self.logger = logger
+        self._lock = Lock()
+        self._stopped = False
+        self._thread_ended = False
+        self._closed = False
+
+    def run(self, target: Callable, *args):
+        """
+        Execute the thread function, and close the handlers after it if the process has
+        already been stopped. It's the target of the thread.
+
+        Parameters
+        ----------
+        target : Callable
+            Function performing the automatic process.
+        args
+            Arguments passed to target.
+        """
+        try:
+            target(*args)
+        finally:
+            self._mark(thread_ended=True)
+
+    def stopped(self, thread_started: bool = True):
+        """
+        Notify that the process has been stopped, closing the handlers now if the thread
+        has already ended, or once it ends otherwise.
+
+        Parameters
+        ----------
+        thread_started : bool
+            False if the thread was never started, so the handlers are closed now.
+        """
+        self._mark(stopped=True, thread_ended=not thread_started)
+
+    def _mark(self, stopped: bool = False, thread_ended: bool = False):
+        with self._lock:
+            self._stopped = self._stopped or stopped
+            self._thread_ended = self._thread_ended or thread_ended
+            must_close = self._stopped and self._thread_ended and not self._closed
+            if must_close:
+                self._closed = True
+        if must_close:
+            for handler in self.logger.handlers[:]:
+                handler.close()
+                self.logger.removeHandler(handler)
@@ -12,8 +12,9 @@ automatically the Sun.
 """___Built-In Modules___"""
 from typing import List
 import time
+import datetime
 import logging
-from threading import Thread, Lock
+from threading import Thread, current_thread
 from typing import Callable
 
 """___Third-Party Modules___"""
@@ -39,12 +40,15 @@ __maintainer__ = "Javier Gatón Herguedas"
 __email__ = "gaton@goa.uva.es"
 __status__ = "Development"
 
-def _track_body(ip: str, seconds: float, library: psc._BodyLibrary, mutex_cont: Lock,
-    cont_track: common.ContainedBool, logger: logging.Logger, port: int = 15000,
+_MAX_ERROR_BACKOFF = 30
+
+def _track_body(ip: str, seconds: float, library: psc._BodyLibrary,
+    cont_track: common.StopSignal, logger: logging.Logger, port: int = 15000,
     password: str = "solys", is_finished: common.ContainedBool = None,
     altitude: float = 0, kernels_path: str = "./kernels",
     solys_delay: float = common.SOLYS_APPROX_DELAY, inst_callback: Callable = None,
-    instrument_delay: float = common.ASD_DELAY):
+    instrument_delay: float = common.ASD_DELAY,
+    solys: solys2.Solys2 = None, interp_seconds: float = 0):
     """
     Track a celestial body
 
@@ -56,11 +60,9 @@ def _track_body(ip: str, seconds: float, library: psc._BodyLibrary, mutex_cont:
         Amount of seconds waited between each message of change of position of zenith and azimuth.
     library : _BodyLibrary
         Body library that will be used to track the body. Moon or Sun.
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the tracking must stop or if it should
-        continue. It should be initialized to True.
+    cont_track : StopSignal
+        Signal that represents if the tracking must stop or if it should continue. It should be
+        initialized to True.
     logger : logging.Logger
         Logger that will log out the log messages
     port : int
@@ -83,22 +85,30 @@ def _track_body(ip: str, seconds: float, library: psc._BodyLibrary, mutex_cont:
         If None nothing will be executed. By default it's None.
     instrument_delay : float
         Approximate time in seconds that the measure instrument takes in each measurement.
+    solys : Solys2
+        Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+        when finishing. By default None, a new connection is created and closed.
+    interp_seconds : float
+        If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+        and reused across the tracking iterations, interpolating between them. Less accurate.
+        By default 0 (exact positions).
 
     Raises
     ------
     SolysException
         If an error happens when stablishing connection with the Solys2 for the first time.
     """
+    owns_solys = solys is None
     try:
         # Connect with the Solys2 and set the initial configuration.
-        solys = solys2.Solys2(ip, port, password)
-        solys.set_power_save(False)
-        body_calc = autohelper.get_body_calculator(solys, library, logger, altitude, kernels_path)
-        if library.value in [l.value for l in psc.SunLibrary]:
+        if owns_solys:
+            solys = solys2.Solys2(ip, port, password)
+        if autohelper.is_sun_library(library):
             logger.info("Tracking sun. Connected with Solys2.")
         else:
             logger.info("Tracking moon. Connected with Solys2.")
-        autohelper.check_time_solys(solys, logger)
+        body_calc = autohelper.prepare_solys(solys, library, logger, altitude, kernels_path,
+            interp_seconds)
         # Start tracking in a loop
         sleep_time = 0
         inst_measures = inst_callback is not None
@@ -106,28 +116,39 @@ def _track_body(ip: str, seconds: float, library: psc._BodyLibrary, mutex_cont:
             time_offset = ((seconds - solys_delay) / 2.0) + solys_delay
         else:
             time_offset = ((instrument_delay) / 2.0) + solys_delay
-        t0 = time.time()
-        mutex_cont.acquire()
+        time_offset_td = datetime.timedelta(seconds=time_offset)
+        failures = 0
+        t0 = time.monotonic()
         while cont_track.value:
-            mutex_cont.release()
-            logger.debug("Waited {} seconds.\n".format(sleep_time))
-            autohelper.read_and_move(solys, body_calc, logger, datetime_offset=time_offset)
+            logger.debug("Waited %s seconds.\n", sleep_time)
+            status = autohelper.read_and_move(solys, body_calc, logger,
+                datetime_offset=time_offset_td)
+            if status == autohelper.MoveStatus.FATAL:
+                raise ConnectionError("Lost the connection with the Solys2.")
             if inst_measures:
                 inst_callback()
-            tf = time.time()
+            tf = time.monotonic()
             tdiff = tf - t0
             sleep_time = (seconds - tdiff)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            t0 = time.time()
-            mutex_cont.acquire()
-        mutex_cont.release()
-        solys.close()
+            if status == autohelper.MoveStatus.TRANSIENT:
+                # Wait longer after each consecutive error, so a failing Solys2 isn't flooded
+                failures += 1
+                backoff = min(2 ** (failures - 1), _MAX_ERROR_BACKOFF)
+                logger.warning("%s consecutive failed movements. Waiting at least %s seconds.",
+                    failures, backoff)
+                sleep_time = max(sleep_time, backoff)
+            else:
+                failures = 0
+            if sleep_time > 0 and autohelper.sleep_unless_stopped(sleep_time, cont_track):
+                break
+            t0 = time.monotonic()
+        if owns_solys:
+            solys.close()
         if is_finished:
             is_finished.value = True
         logger.info("Tracking stopped and connection closed.")
     except Exception as e:
-        autohelper.exception_tracking(logger, e, solys, is_finished)
+        autohelper.exception_tracking(logger, e, solys, is_finished, owns_solys)
 
 class _BodyTracker(autohelper.AutomationWorker):
     """_BodyTracker
@@ -136,24 +157,24 @@ class _BodyTracker(autohelper.AutomationWorker):
 
     Attributes
     ----------
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the tracking must stop or if it should
-        continue.
+    cont_track : StopSignal
+        Signal that represents if the tracking must stop or if it should continue.
     logger : logging.Logger
         Logger that will log out the log messages.
     thread : Thread
         Thread that will execute the tracking function.
-    _is_finished : ContainedBool
+    _is_finished : FinishedSignal
         Container for the boolean value that initially will be False, but it will be True
         when the thread has successfully ended execution.
+    _logger_closer : autohelper.LoggerCloser
+        Closes the logger handlers once the process is stopped and the thread has ended.
     """
     def __init__(self, ip: str, seconds: float, library: psc._BodyLibrary, port: int = 15000,
         password: str = "solys", logger: logging.Logger = None,
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY, inst_callback: Callable = None,
-        instrument_delay: float = common.ASD_DELAY):
+        instrument_delay: float = common.ASD_DELAY,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -184,37 +205,51 @@ class _BodyTracker(autohelper.AutomationWorker):
             If None nothing will be executed. By default it's None.
         instrument_delay : float
             Approximate time in seconds that the measure instrument takes in each measurement.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            and reused across the tracking iterations, interpolating between them. Less accurate.
+            By default 0 (exact positions).
         """
-        self.mutex_cont = Lock()
-        self.cont_track = common.ContainedBool(True)
+        self.cont_track = common.StopSignal(True)
+        # Import the library now, so the thread doesn't do it before its first movement
+        psc.preload_library(library)
         if logger == None:
             logger = common.create_default_logger()
         self.logger = logger
-        self._is_finished = common.ContainedBool(False)
+        self._is_finished = common.FinishedSignal(False)
         # Create thread
-        self.thread = Thread(target = _track_body, args = (ip, seconds, library, self.mutex_cont,
-            self.cont_track, self.logger, port, password, self._is_finished, altitude,
-            kernels_path, solys_delay, inst_callback, instrument_delay))
+        self._logger_closer = autohelper.LoggerCloser(self.logger)
+        self.thread = Thread(target = self._logger_closer.run, args = (_track_body, ip,
+            seconds, library, self.cont_track, self.logger, port, password, self._is_finished,
+            altitude, kernels_path, solys_delay, inst_callback, instrument_delay, solys,
+            interp_seconds), name = autohelper.worker_thread_name("track"))
 
     def start(self):
         """Start tracking the previously selected body."""
         self.thread.start()
 
-    def stop(self):
+    def stop(self, timeout: float = 0):
         """
         Stop the tracking of the tracked body. The connection with the Solys2 will be closed and
         the thread stopped.
 
-        It won't be stopped immediately, at most there will be a delay of __init__ "seconds"
-        parameter.
+        The wait between positions is interrupted, but if the Solys2 is moving the thread
+        will stop once it finishes that movement.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds waited for the thread to finish. By default 0, it
+            doesn't wait. The logger handlers are closed once the thread finishes, so its
+            last messages are logged.
         """
-        self.mutex_cont.acquire()
         self.cont_track.value = False
-        self.mutex_cont.release()
-        handlers = self.logger.handlers
-        for handler in handlers:
-            handler.close()
-            self.logger.removeHandler(handler)
+        if timeout > 0 and self.thread.is_alive() and self.thread is not current_thread():
+            self.thread.join(timeout)
+        self._logger_closer.stopped(self.thread.ident is not None)
     
     def is_finished(self) -> bool:
         """
@@ -228,6 +263,23 @@ class _BodyTracker(autohelper.AutomationWorker):
         """
         return self._is_finished.value
 
+    def wait_finished(self, timeout: float = None) -> bool:
+        """
+        Wait until the thread has successfully finished executing, instead of polling
+        is_finished(). This requires having had called stop(), or the operation ending.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds that will be waited. If None it waits indefinitely.
+
+        Returns
+        -------
+        has_finished : bool
+            True if it has finished successfully, False if the timeout expired first.
+        """
+        return self._is_finished.wait(timeout)
+
 class MoonTracker(_BodyTracker):
     """MoonTracker
     Object that when created will create a thread executing the function of controlling the
@@ -237,7 +289,8 @@ class MoonTracker(_BodyTracker):
         logger: logging.Logger = None, library: psc.MoonLibrary = psc.MoonLibrary.EPHEM_MOON,
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY, inst_callback: Callable = None,
-        instrument_delay: float = common.ASD_DELAY):
+        instrument_delay: float = common.ASD_DELAY,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -268,9 +321,16 @@ class MoonTracker(_BodyTracker):
             If None nothing will be executed. By default it's None.
         instrument_delay : float
             Approximate time in seconds that the measure instrument takes in each measurement.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            and reused across the tracking iterations, interpolating between them. Less accurate.
+            By default 0 (exact positions).
         """
         super().__init__(ip, seconds, library, port, password, logger, altitude,
-            kernels_path, solys_delay, inst_callback, instrument_delay)
+            kernels_path, solys_delay, inst_callback, instrument_delay, solys, interp_seconds)
 
 class SunTracker(_BodyTracker):
     """SunTracker
@@ -281,7 +341,8 @@ class SunTracker(_BodyTracker):
         logger: logging.Logger = None, library: psc.SunLibrary = psc.SunLibrary.PYSOLAR,
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY, inst_callback: Callable = None,
-        instrument_delay: float = common.ASD_DELAY):
+        instrument_delay: float = common.ASD_DELAY,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -312,6 +373,13 @@ class SunTracker(_BodyTracker):
             If None nothing will be executed. By default it's None.
         instrument_delay : float
             Approximate time in seconds that the measure instrument takes in each measurement.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            and reused across the tracking iterations, interpolating between them. Less accurate.
+            By default 0 (exact positions).
         """
         super().__init__(ip, seconds, library, port, password, logger, altitude,
-            kernels_path, solys_delay, inst_callback, instrument_delay)
+            kernels_path, solys_delay, inst_callback, instrument_delay, solys, interp_seconds)
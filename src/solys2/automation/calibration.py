@@ -20,11 +20,12 @@ present so the noise can be calculated. (Opposite azimuth and zenith = 45).
 
 """___Built-In Modules___"""
 from dataclasses import dataclass
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, Union
 import time
 import datetime
 import logging
-from threading import Lock, Thread
+import math
+from threading import Thread, current_thread
 
 """___Third-Party Modules___"""
 import numpy as np
@@ -41,11 +42,13 @@ except:
     from solys2 import common
     from solys2 import solys2
 
-@dataclass
+@dataclass(frozen=True)
 class CalibrationParameters:
     """
     Parameters needed when performing a cross or a mesh over a Body.
 
+    It's immutable and hashable, so it can be shared between threads and used as a key.
+
     The offset attributes will define the interval that will be per
 
     Attributes
@@ -80,10 +83,39 @@ class CalibrationParameters:
     countdown: int
     post_wait: int
 
+# Tolerance, in steps, for floating point errors when counting the offsets of an interval
+_OFFSET_EPSILON = 1e-9
+
+def _offset_range(min_offset: float, max_offset: float, step: float) -> np.ndarray:
+    """
+    Offsets from min_offset to max_offset, both included, separated by step.
+
+    The number of points is calculated beforehand, so floating point errors in the step
+    don't add or remove points at the end of the interval.
+
+    Parameters
+    ----------
+    min_offset : float
+        First offset.
+    max_offset : float
+        Last offset, included if the interval is a multiple of step.
+    step : float
+        Amount of degrees between each offset.
+
+    Returns
+    -------
+    offsets : np.ndarray of float
+        Offsets of the interval.
+    """
+    # The epsilon keeps max_offset when the division falls just below an integer, but
+    # flooring never adds a point past it.
+    num = max(math.floor((max_offset - min_offset) / step + _OFFSET_EPSILON) + 1, 0)
+    return min_offset + np.arange(num) * step
+
 def _perform_offsets_body(solys: solys2.Solys2, logger: logging.Logger,
-    offsets: List[Tuple[float, float]], body_calc: psc.BodyCalculator, cp: CalibrationParameters,
-    mutex_cont: Lock = None, cont_track: common.ContainedBool = None,
-    solys_delay: float = common.SOLYS_APPROX_DELAY,
+    offsets: Union[np.ndarray, List[Tuple[float, float]]], body_calc: psc.BodyCalculator,
+    cp: CalibrationParameters,
+    cont_track: common.StopSignal = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
     solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
     instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
     """
@@ -95,17 +127,16 @@ def _perform_offsets_body(solys: solys2.Solys2, logger: logging.Logger,
         Solys2 instance that will be used to send de messages with.
     logger : logging.Logger
         Logger that will log out the log messages.
-    offsets : list of tuple of floats
-        List of offsets (az, ze) that will be performed.
+    offsets : np.ndarray of float or list of tuple of floats
+        Offsets (az, ze) that will be performed, as an array of shape (N, 2) or a list
+        of tuples.
     body_calc : BodyCalculator
         Calculator that will be able to calculate the position of the body for a given date.
     cp : CalibrationParameters
         Parameters needed when performing a cross/mesh over a Body.
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track.
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the tracking must stop or if it should
-        continue.
+    cont_track : StopSignal
+        Signal that represents if the operation must stop or if it should continue. If None
+        the operation can't be stopped.
     solys_delay : float
         Approximate delay in seconds between telling the Solys2 to move to a position and
         the Solys2 saying that it reached that position.
@@ -118,79 +149,151 @@ def _perform_offsets_body(solys: solys2.Solys2, logger: logging.Logger,
     inst_callback : Callable
         Function that will be executed synchronously when the countdown reaches 0. If None
         nothing will be executed. By default it's None.
+
+    If the Solys2 fails to move to an offset, a warning is logged and the measurement at
+    that offset is skipped.
     """
-    stoppable: bool = False
-    if mutex_cont and cont_track:
-        stoppable = True
     sleep_time0 = 0
     sleep_time1 = 0
     solys_tot_delay = solys_delay + solys_delay_margin
     dt_offset = cp.countdown + instrument_delay/2.0 + solys_tot_delay
+    dt_offset_td = datetime.timedelta(seconds=dt_offset)
+    # tolist returns python floats, which is what read_and_move works with
+    offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 2).tolist()
     for offset in offsets:
-        if stoppable:
-            mutex_cont.acquire()
-        if stoppable and not cont_track.value:
+        if cont_track is not None and not cont_track.value:
             logger.info("Operation stopped manually.")
             break
-        if stoppable:
-            mutex_cont.release()
-        t0 = time.time()
-        autohelper.read_and_move(solys, body_calc, logger, offset, datetime_offset=dt_offset)
+        t0 = time.monotonic()
+        status = autohelper.read_and_move(solys, body_calc, logger, offset,
+            datetime_offset=dt_offset_td)
+        if status == autohelper.MoveStatus.FATAL:
+            raise ConnectionError("Lost the connection with the Solys2.")
+        if status == autohelper.MoveStatus.TRANSIENT:
+            # Measuring at a position that wasn't reached would give a wrong point
+            logger.warning("The Solys2 didn't reach the offset (%s, %s). Skipping its \
+measurement.", offset[0], offset[1])
+            continue
         sleep_time0 = cp.countdown
-        tf = time.time()
+        tf = time.monotonic()
         diff_td = tf - t0
         wait_time = (dt_offset - instrument_delay/2.0) - (diff_td + sleep_time0)
         if wait_time > 0:
-            logger.debug("Sleeping {} seconds".format(wait_time))
-            time.sleep(wait_time)
+            # The fractional part of the countdown is slept here, the countdown uses whole seconds
+            sleep_mid = sleep_time0 - int(sleep_time0)
+            sleep_time0 = int(sleep_time0)
+            logger.debug("Sleeping %s seconds", wait_time + sleep_mid)
+            if autohelper.sleep_unless_stopped(wait_time + sleep_mid, cont_track):
+                logger.info("Operation stopped manually.")
+                break
         else:
             # If it waited too much time, that time is substracted from the countdown
             final_sleep_time0 = sleep_time0 + wait_time # wait_time is negative
             sleep_time0 = int(final_sleep_time0)
             sleep_mid = final_sleep_time0-sleep_time0
             logger.warning("The Solys2 spent more time moving than expected, reducing the \
-countdown to {}, and sleeping an extra {}.".format(sleep_time0, sleep_mid))
+countdown to %s, and sleeping an extra %s.", sleep_time0, sleep_mid)
             if final_sleep_time0 > 0:
-                time.sleep(sleep_mid)
+                if autohelper.sleep_unless_stopped(sleep_mid, cont_track):
+                    logger.info("Operation stopped manually.")
+                    break
             else:
                 error_msg = "The difference between the Solys2 delay and actual delay is too \
 large. Increase the countdown or the values of the solys2 delay parameters."
                 raise Exception(error_msg)
+        # Each tick sleeps until its deadline, so the logging time doesn't accumulate
+        countdown_start = time.monotonic()
+        stopped = False
         for i in range(sleep_time0):
-            logger.info("COUNTDOWN:{}".format(sleep_time0-i))
-            time.sleep(1)
+            logger.info("COUNTDOWN:%s", sleep_time0-i)
+            if autohelper.sleep_unless_stopped(countdown_start + i + 1 - time.monotonic(),
+                    cont_track):
+                stopped = True
+                break
+        if stopped:
+            logger.info("Operation stopped manually.")
+            break
         logger.info("COUNTDOWN:0")
         if inst_callback:
             logger.info("Executing callback function.")
             inst_callback()
         else:
-            logger.debug("Sleeping {} seconds, the instrument delay.".format(instrument_delay))
+            logger.debug("Sleeping %s seconds, the instrument delay.", instrument_delay)
             time.sleep(instrument_delay)
         sleep_time1 = cp.post_wait
-        logger.debug("Waiting {} seconds (post).".format(sleep_time1))
-        if sleep_time1 > 0:
-            time.sleep(sleep_time1)
+        logger.debug("Waiting %s seconds (post).", sleep_time1)
+        if sleep_time1 > 0 and autohelper.sleep_unless_stopped(sleep_time1, cont_track):
+            logger.info("Operation stopped manually.")
+            break
 
-def _cross_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger,
-    cross_params: CalibrationParameters, port: int = 15000, password: str = "solys",
-    is_finished: common.ContainedBool = None, altitude: float = 0,
-    kernels_path: str = "./kernels", mutex_cont: Lock = None,
-    cont_track: common.ContainedBool = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
+def _cross_offsets(cp: CalibrationParameters) -> np.ndarray:
+    """
+    Offsets of a cross: first the azimuth offsets with no zenith offset, then the zenith
+    offsets with no azimuth offset.
+
+    Parameters
+    ----------
+    cp : CalibrationParameters
+        Parameters of the cross.
+
+    Returns
+    -------
+    offsets : np.ndarray of float
+        Offsets (az, ze) of the cross, with shape (N, 2).
+    """
+    az_offs = _offset_range(cp.azimuth_min_offset, cp.azimuth_max_offset, cp.azimuth_step)
+    ze_offs = _offset_range(cp.zenith_min_offset, cp.zenith_max_offset, cp.zenith_step)
+    offsets = np.zeros((len(az_offs) + len(ze_offs), 2))
+    offsets[:len(az_offs), 0] = az_offs
+    offsets[len(az_offs):, 1] = ze_offs
+    return offsets
+
+def _mesh_offsets(cp: CalibrationParameters) -> np.ndarray:
+    """
+    Offsets of a mesh: every combination of azimuth and zenith offsets, azimuth-major.
+
+    Parameters
+    ----------
+    cp : CalibrationParameters
+        Parameters of the mesh.
+
+    Returns
+    -------
+    offsets : np.ndarray of float
+        Offsets (az, ze) of the mesh, with shape (N, 2).
+    """
+    az_offs = _offset_range(cp.azimuth_min_offset, cp.azimuth_max_offset, cp.azimuth_step)
+    ze_offs = _offset_range(cp.zenith_min_offset, cp.zenith_max_offset, cp.zenith_step)
+    az_grid, ze_grid = np.meshgrid(az_offs, ze_offs, indexing='ij')
+    return np.column_stack((az_grid.ravel(), ze_grid.ravel()))
+
+def _run_offset_pattern(pattern_name: str,
+    offsets_func: Callable[[CalibrationParameters], np.ndarray], ip: str,
+    library: psc._BodyLibrary, logger: logging.Logger, params: CalibrationParameters,
+    port: int = 15000, password: str = "solys", is_finished: common.ContainedBool = None,
+    altitude: float = 0, kernels_path: str = "./kernels",
+    cont_track: common.StopSignal = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
     solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-    instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+    instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+    solys: solys2.Solys2 = None, interp_seconds: float = 0):
     """
-    Perform a cross over a body
+    Perform a pattern of offsets (cross or mesh) over a body
 
     Parameters
     ----------
+    pattern_name : str
+        Name of the pattern, used in the log messages. "cross" or "mesh".
+    offsets_func : Callable
+        Function that receives the CalibrationParameters and returns the offsets of the pattern,
+        as an array of shape (N, 2).
     ip : str
         IP of the solys.
     library : _BodyLibrary
         Body library that will be used to track the body. Moon or Sun.
     logger : logging.Logger
         Logger that will log out the log messages
-    cross_params : CalibrationParameters
-        Parameters needed when performing a cross over a Body.
+    params : CalibrationParameters
+        Parameters needed when performing the cross/mesh over a Body.
     port : int
         Access port. By default 15000.
     password : str
@@ -203,11 +306,9 @@ def _cross_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger,
     kernels_path : str
         Directory where the needed SPICE kernels are stored. Used only if SPICE library
         is selected.
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the tracking must stop or if it should
-        continue. It should be initialized to True.
+    cont_track : StopSignal
+        Signal that represents if the operation must stop or if it should continue. It should
+        be initialized to True.
     solys_delay : float
         Approximate delay in seconds between telling the Solys2 to move to a position and
         the Solys2 saying that it reached that position.
@@ -220,40 +321,105 @@ def _cross_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger,
     inst_callback : Callable
         Function that will be executed synchronously when the countdown reaches 0. If None
         nothing will be executed. By default it's None.
+    solys : Solys2
+        Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+        when finishing. By default None, a new connection is created and closed.
+    interp_seconds : float
+        If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+        in batches, interpolating between them. Less accurate. By default 0 (exact positions).
     """
+    owns_solys = solys is None
     try:
         # Connect with the Solys2 and set the initial configuration.
-        solys = solys2.Solys2(ip, port, password)
-        solys.set_power_save(False)
-        body_calc = autohelper.get_body_calculator(solys, library, logger, altitude, kernels_path)
-        if library in psc.SunLibrary:
-            logger.info("Performing a solar cross. Connected with Solys2.")
+        if owns_solys:
+            solys = solys2.Solys2(ip, port, password)
+        if autohelper.is_sun_library(library):
+            logger.info("Performing a solar %s. Connected with Solys2.", pattern_name)
         else:
-            logger.info("Performing a lunar cross. Connected with Solys2.")
-        cp = cross_params
-        logger.info("Performing cross with azimuth range [{},{}], steps {}, and zenith range \
-[{},{}], steps {}. Countdown of {} and post wait of {} seconds".format(cp.azimuth_min_offset,
-            cp.azimuth_max_offset, cp.azimuth_step, cp.zenith_min_offset, cp.zenith_max_offset,
-            cp.zenith_step, cp.countdown, cp.post_wait))
-        autohelper.check_time_solys(solys, logger)
+            logger.info("Performing a lunar %s. Connected with Solys2.", pattern_name)
+        body_calc = autohelper.prepare_solys(solys, library, logger, altitude, kernels_path,
+            interp_seconds)
+        cp = params
+        logger.info("Performing %s with azimuth range [%s,%s], steps %s, and zenith range \
+[%s,%s], steps %s. Countdown of %s and post wait of %s seconds", pattern_name,
+            cp.azimuth_min_offset, cp.azimuth_max_offset, cp.azimuth_step, cp.zenith_min_offset,
+            cp.zenith_max_offset, cp.zenith_step, cp.countdown, cp.post_wait)
         # Generating the offsets
-        offsets: List[Tuple[float, float]] = \
-            [(i, 0) for i in np.arange(cp.azimuth_min_offset, cp.azimuth_max_offset +
-                cp.azimuth_step, cp.azimuth_step)]
-        offsets += [(0, i) for i in np.arange(cp.zenith_min_offset, cp.zenith_max_offset +
-            cp.zenith_step, cp.zenith_step)]
+        offsets = offsets_func(cp)
         logger.debug("Moving next to the body...")
-        autohelper.read_and_move(solys, body_calc, logger, (0,0))
+        status = autohelper.read_and_move(solys, body_calc, logger, (0,0))
+        if status == autohelper.MoveStatus.FATAL:
+            raise ConnectionError("Lost the connection with the Solys2.")
         logger.debug("Moved next to the body.")
-        logger.info("Starting cross")
-        _perform_offsets_body(solys, logger, offsets, body_calc, cp, mutex_cont, cont_track,
+        logger.info("Starting %s", pattern_name)
+        _perform_offsets_body(solys, logger, offsets, body_calc, cp, cont_track,
             solys_delay, solys_delay_margin, instrument_delay, inst_callback)
-        solys.close()
+        if owns_solys:
+            solys.close()
         if is_finished:
             is_finished.value = True
         logger.info("Tracking stopped and connection closed.")
     except Exception as e:
-        autohelper.exception_tracking(logger, e, solys, is_finished)
+        autohelper.exception_tracking(logger, e, solys, is_finished, owns_solys)
+
+def _cross_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger,
+    cross_params: CalibrationParameters, port: int = 15000, password: str = "solys",
+    is_finished: common.ContainedBool = None, altitude: float = 0,
+    kernels_path: str = "./kernels",
+    cont_track: common.StopSignal = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
+    solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
+    instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+    solys: solys2.Solys2 = None, interp_seconds: float = 0):
+    """
+    Perform a cross over a body
+
+    Parameters
+    ----------
+    ip : str
+        IP of the solys.
+    library : _BodyLibrary
+        Body library that will be used to track the body. Moon or Sun.
+    logger : logging.Logger
+        Logger that will log out the log messages
+    cross_params : CalibrationParameters
+        Parameters needed when performing a cross over a Body.
+    port : int
+        Access port. By default 15000.
+    password : str
+        Ethernet user password. By default is "solys".
+    is_finished : ContainedBool
+        Container for the boolean value that initially will be False, but it should be changed
+        to True when exiting the function.
+    altitude : float
+        Altitude in meters of the observer point. Used only if SPICE library is selected.
+    kernels_path : str
+        Directory where the needed SPICE kernels are stored. Used only if SPICE library
+        is selected.
+    cont_track : StopSignal
+        Signal that represents if the operation must stop or if it should continue. It should
+        be initialized to True.
+    solys_delay : float
+        Approximate delay in seconds between telling the Solys2 to move to a position and
+        the Solys2 saying that it reached that position.
+    solys_delay_margin : float
+        Time margin in seconds where solys_delay + solys_delay_margin = enough time for the
+        Solys2 to move to a position and confirm that it has reached it, since the moment when
+        the "move position" command was sent, (for most cases).
+    instrument_delay : float
+        Approximate time in seconds that the measure instrument takes in each measurement.
+    inst_callback : Callable
+        Function that will be executed synchronously when the countdown reaches 0. If None
+        nothing will be executed. By default it's None.
+    solys : Solys2
+        Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+        when finishing. By default None, a new connection is created and closed.
+    interp_seconds : float
+        If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+        in batches, interpolating between them. Less accurate. By default 0 (exact positions).
+    """
+    _run_offset_pattern("cross", _cross_offsets, ip, library, logger, cross_params, port, password,
+        is_finished, altitude, kernels_path, cont_track, solys_delay,
+        solys_delay_margin, instrument_delay, inst_callback, solys, interp_seconds)
 
 class _BodyCross(autohelper.AutomationWorker):
     """_BodyCross
@@ -262,25 +428,25 @@ class _BodyCross(autohelper.AutomationWorker):
 
     Attributes
     ----------
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the thread must stop or if it should
-        continue.
+    cont_track : StopSignal
+        Signal that represents if the thread must stop or if it should continue.
     logger : logging.Logger
         Logger that will log out the log messages.
     thread : Thread
         Thread that will execute the cross function.
-    _is_finished : ContainedBool
+    _is_finished : FinishedSignal
         Container for the boolean value that initially will be False, but it will be True
         when the thread has successfully ended execution.
+    _logger_closer : autohelper.LoggerCloser
+        Closes the logger handlers once the process is stopped and the thread has ended.
     """
     def __init__(self, ip: str, cross_params: CalibrationParameters, library: psc._BodyLibrary,
         logger: logging.Logger = None, port: int = 15000, password: str = "solys",
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -313,36 +479,50 @@ class _BodyCross(autohelper.AutomationWorker):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
-        self.mutex_cont = Lock()
-        self.cont_track = common.ContainedBool(True)
+        self.cont_track = common.StopSignal(True)
+        # Import the library now, so the thread doesn't do it before its first movement
+        psc.preload_library(library)
         if logger == None:
             logger = common.create_default_logger()
         self.logger = logger
-        self._is_finished = common.ContainedBool(False)
+        self._is_finished = common.FinishedSignal(False)
         # Create thread
-        self.thread = Thread(target = _cross_body, args = (ip, library, self.logger, cross_params,
-            port, password, self._is_finished, altitude, kernels_path, self.mutex_cont,
-            self.cont_track, solys_delay, solys_delay_margin, instrument_delay, inst_callback))
+        self._logger_closer = autohelper.LoggerCloser(self.logger)
+        self.thread = Thread(target = self._logger_closer.run, args = (_cross_body, ip, library,
+            self.logger, cross_params, port, password, self._is_finished, altitude, kernels_path,
+            self.cont_track, solys_delay, solys_delay_margin, instrument_delay, inst_callback,
+            solys, interp_seconds), name = autohelper.worker_thread_name("cross"))
     
     def start(self):
         """Start the cross for the previously selected body."""
         self.thread.start()
     
-    def stop(self):
+    def stop(self, timeout: float = 0):
         """
         Stop the cross over the selected body. The connection with the Solys2 will be closed and
         the thread stopped.
 
-        It won't be stopped immediately, at most there will be a delay of some seconds.
+        The waits are interrupted, but if the Solys2 is moving the thread will stop once it
+        finishes that movement.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds waited for the thread to finish. By default 0, it
+            doesn't wait. The logger handlers are closed once the thread finishes, so its
+            last messages are logged.
         """
-        self.mutex_cont.acquire()
         self.cont_track.value = False
-        self.mutex_cont.release()
-        handlers = self.logger.handlers
-        for handler in handlers:
-            handler.close()
-            self.logger.removeHandler(handler)
+        if timeout > 0 and self.thread.is_alive() and self.thread is not current_thread():
+            self.thread.join(timeout)
+        self._logger_closer.stopped(self.thread.ident is not None)
     
     def is_finished(self) -> bool:
         """
@@ -355,6 +535,23 @@ class _BodyCross(autohelper.AutomationWorker):
         """
         return self._is_finished.value
 
+    def wait_finished(self, timeout: float = None) -> bool:
+        """
+        Wait until the thread has successfully finished executing, instead of polling
+        is_finished(). This requires having had called stop(), or the operation ending.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds that will be waited. If None it waits indefinitely.
+
+        Returns
+        -------
+        has_finished : bool
+            True if it has finished successfully, False if the timeout expired first.
+        """
+        return self._is_finished.wait(timeout)
+
 class LunarCross(_BodyCross):
     """LunarCross
     Object that when created will create a thread executing the function of controlling the
@@ -366,7 +563,8 @@ class LunarCross(_BodyCross):
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -399,9 +597,16 @@ class LunarCross(_BodyCross):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
         super().__init__(ip, cross_params, library, logger, port, password, altitude,
-            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback)
+            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback, solys,
+            interp_seconds)
 
 class SolarCross(_BodyCross):
     """SolarCross
@@ -414,7 +619,8 @@ class SolarCross(_BodyCross):
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -447,16 +653,24 @@ class SolarCross(_BodyCross):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
         super().__init__(ip, cross_params, library, logger, port, password, altitude,
-            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback)
+            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback, solys,
+            interp_seconds)
 
 def _mesh_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger, mesh_params: CalibrationParameters,
     port: int = 15000, password: str = "solys", is_finished: common.ContainedBool = None,
-    altitude: float = 0, kernels_path: str = "./kernels", mutex_cont: Lock = None,
-    cont_track: common.ContainedBool = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
+    altitude: float = 0, kernels_path: str = "./kernels",
+    cont_track: common.StopSignal = None, solys_delay: float = common.SOLYS_APPROX_DELAY,
     solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-    instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+    instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+    solys: solys2.Solys2 = None, interp_seconds: float = 0):
     """
     Perform a mesh/matrix over a body
 
@@ -482,11 +696,9 @@ def _mesh_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger, mesh_
     kernels_path : str
         Directory where the needed SPICE kernels are stored. Used only if SPICE library
         is selected.
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the tracking must stop or if it should
-        continue.
+    cont_track : StopSignal
+        Signal that represents if the operation must stop or if it should continue. It should
+        be initialized to True.
     solys_delay : float
         Approximate delay in seconds between telling the Solys2 to move to a position and
         the Solys2 saying that it reached that position.
@@ -499,41 +711,16 @@ def _mesh_body(ip: str, library: psc._BodyLibrary, logger: logging.Logger, mesh_
     inst_callback : Callable
         Function that will be executed synchronously when the countdown reaches 0. If None
         nothing will be executed. By default it's None.
+    solys : Solys2
+        Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+        when finishing. By default None, a new connection is created and closed.
+    interp_seconds : float
+        If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+        in batches, interpolating between them. Less accurate. By default 0 (exact positions).
     """
-    try:
-        # Connect with the Solys2 and set the initial configuration.
-        solys = solys2.Solys2(ip, port, password)
-        solys.set_power_save(False)
-        body_calc = autohelper.get_body_calculator(solys, library, logger, altitude, kernels_path)
-        if library in psc.SunLibrary:
-            logger.info("Performing a solar mesh. Connected with Solys2.")
-        else:
-            logger.info("Performing a lunar mesh. Connected with Solys2.")
-        cp = mesh_params
-        logger.info("Performing mesh with azimuth range [{},{}], steps {}, and zenith range \
-[{},{}], steps {}. Countdown of {} and post wait of {} seconds".format(cp.azimuth_min_offset,
-            cp.azimuth_max_offset, cp.azimuth_step, cp.zenith_min_offset, cp.zenith_max_offset,
-            cp.zenith_step, cp.countdown, cp.post_wait))
-        autohelper.check_time_solys(solys, logger)
-        # Generating the offsets
-        offsets: List[Tuple[float, float]] = []
-        for i in np.arange(cp.azimuth_min_offset, cp.azimuth_max_offset + cp.azimuth_step,
-                cp.azimuth_step):
-            for j in np.arange(cp.zenith_min_offset, cp.zenith_max_offset + cp.zenith_step,
-                    cp.zenith_step):
-                offsets.append((i,j))
-        logger.debug("Moving next to the body...")
-        autohelper.read_and_move(solys, body_calc, logger, (0,0))
-        logger.debug("Moved next to the body.")
-        logger.info("Starting mesh")
-        _perform_offsets_body(solys, logger, offsets, body_calc, cp, mutex_cont, cont_track,
-            solys_delay, solys_delay_margin, instrument_delay, inst_callback)
-        solys.close()
-        if is_finished:
-            is_finished.value = True
-        logger.info("Tracking stopped and connection closed.")
-    except Exception as e:
-        autohelper.exception_tracking(logger, e, solys, is_finished)
+    _run_offset_pattern("mesh", _mesh_offsets, ip, library, logger, mesh_params, port, password,
+        is_finished, altitude, kernels_path, cont_track, solys_delay,
+        solys_delay_margin, instrument_delay, inst_callback, solys, interp_seconds)
 
 class _BodyMesh(autohelper.AutomationWorker):
     """_BodyMesh
@@ -542,25 +729,25 @@ class _BodyMesh(autohelper.AutomationWorker):
 
     Attributes
     ----------
-    mutex_cont : Lock
-        Mutex that controls the access to the variable cont_track
-    cont_track : ContainedBool
-        Container for the boolean value that represents if the thread must stop or if it should
-        continue.
+    cont_track : StopSignal
+        Signal that represents if the thread must stop or if it should continue.
     logger : logging.Logger
         Logger that will log out the log messages.
     thread : Thread
         Thread that will execute the cross function.
-    _is_finished : ContainedBool
+    _is_finished : FinishedSignal
         Container for the boolean value that initially will be False, but it will be True
         when the thread has successfully ended execution.
+    _logger_closer : autohelper.LoggerCloser
+        Closes the logger handlers once the process is stopped and the thread has ended.
     """
     def __init__(self, ip: str, mesh_params: CalibrationParameters, library: psc._BodyLibrary,
         logger: logging.Logger = None, port: int = 15000, password: str = "solys",
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -593,36 +780,50 @@ class _BodyMesh(autohelper.AutomationWorker):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
-        self.mutex_cont = Lock()
-        self.cont_track = common.ContainedBool(True)
+        self.cont_track = common.StopSignal(True)
+        # Import the library now, so the thread doesn't do it before its first movement
+        psc.preload_library(library)
         if logger == None:
             logger = common.create_default_logger()
         self.logger = logger
-        self._is_finished = common.ContainedBool(False)
+        self._is_finished = common.FinishedSignal(False)
         # Create thread
-        self.thread = Thread(target = _mesh_body, args = (ip, library, self.logger, mesh_params,
-            port, password, self._is_finished, altitude, kernels_path, self.mutex_cont,
-            self.cont_track, solys_delay, solys_delay_margin, instrument_delay, inst_callback))
+        self._logger_closer = autohelper.LoggerCloser(self.logger)
+        self.thread = Thread(target = self._logger_closer.run, args = (_mesh_body, ip, library,
+            self.logger, mesh_params, port, password, self._is_finished, altitude, kernels_path,
+            self.cont_track, solys_delay, solys_delay_margin, instrument_delay, inst_callback,
+            solys, interp_seconds), name = autohelper.worker_thread_name("mesh"))
     
     def start(self):
         """Start the mesh for the previously selected body."""
         self.thread.start()
     
-    def stop(self):
+    def stop(self, timeout: float = 0):
         """
         Stop the mesh over the selected body. The connection with the Solys2 will be closed and
         the thread stopped.
 
-        It won't be stopped immediately, at most there will be a delay of some seconds.
+        The waits are interrupted, but if the Solys2 is moving the thread will stop once it
+        finishes that movement.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds waited for the thread to finish. By default 0, it
+            doesn't wait. The logger handlers are closed once the thread finishes, so its
+            last messages are logged.
         """
-        self.mutex_cont.acquire()
         self.cont_track.value = False
-        self.mutex_cont.release()
-        handlers = self.logger.handlers
-        for handler in handlers:
-            handler.close()
-            self.logger.removeHandler(handler)
+        if timeout > 0 and self.thread.is_alive() and self.thread is not current_thread():
+            self.thread.join(timeout)
+        self._logger_closer.stopped(self.thread.ident is not None)
     
     def is_finished(self) -> bool:
         """
@@ -635,6 +836,23 @@ class _BodyMesh(autohelper.AutomationWorker):
         """
         return self._is_finished.value
 
+    def wait_finished(self, timeout: float = None) -> bool:
+        """
+        Wait until the thread has successfully finished executing, instead of polling
+        is_finished(). This requires having had called stop(), or the operation ending.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds that will be waited. If None it waits indefinitely.
+
+        Returns
+        -------
+        has_finished : bool
+            True if it has finished successfully, False if the timeout expired first.
+        """
+        return self._is_finished.wait(timeout)
+
 class LunarMesh(_BodyMesh):
     """LunarMesh
     Object that when created will create a thread executing the function of controlling the
@@ -646,7 +864,8 @@ class LunarMesh(_BodyMesh):
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -679,9 +898,16 @@ class LunarMesh(_BodyMesh):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
         super().__init__(ip, mesh_params, library, logger, port, password, altitude,
-            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback)
+            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback, solys,
+            interp_seconds)
 
 class SolarMesh(_BodyMesh):
     """SolarMesh
@@ -694,7 +920,8 @@ class SolarMesh(_BodyMesh):
         altitude: float = 0, kernels_path: str = "./kernels",
         solys_delay: float = common.SOLYS_APPROX_DELAY,
         solys_delay_margin: float = common.SOLYS_DELAY_MARGIN,
-        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None):
+        instrument_delay: float = common.ASD_DELAY, inst_callback: Callable = None,
+        solys: solys2.Solys2 = None, interp_seconds: float = 0):
         """
         Parameters
         ----------
@@ -727,14 +954,22 @@ class SolarMesh(_BodyMesh):
         inst_callback : Callable
             Function that will be executed synchronously when the countdown reaches 0. If None
             nothing will be executed. By default it's None.
+        solys : Solys2
+            Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+            when finishing. By default None, a new connection is created and closed.
+        interp_seconds : float
+            If greater than 0, the exact positions are only calculated every interp_seconds seconds,
+            in batches, interpolating between them. Less accurate. By default 0 (exact positions).
         """
         super().__init__(ip, mesh_params, library, logger, port, password, altitude,
-            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback)
+            kernels_path, solys_delay, solys_delay_margin, instrument_delay, inst_callback, solys,
+            interp_seconds)
 
 def black_moon(ip: str, logger: logging.Logger, port: int = 15000,
     password: str = "solys", is_finished: common.ContainedBool = None,
     library: psc.MoonLibrary = psc.MoonLibrary.EPHEM_MOON, altitude: float = 0,
-    kernels_path: str = "./kernels"):
+    kernels_path: str = "./kernels",
+    solys: solys2.Solys2 = None):
     """
     Perform a black for the moon. Point to a position where the moon is not present so the noise
     can be calculated. (Opposite azimuth and zenith = 45)
@@ -759,33 +994,37 @@ def black_moon(ip: str, logger: logging.Logger, port: int = 15000,
     kernels_path : str
         Directory where the needed SPICE kernels are stored. Used only if SPICE library
         is selected.
+    solys : Solys2
+        Connected Solys2 that will be used instead of connecting to ip. It won't be closed
+        when finishing. By default None, a new connection is created and closed.
     """
+    owns_solys = solys is None
     try:
-        solys = solys2.Solys2(ip, port, password)
-        solys.set_power_save(False)
-        body_calc = autohelper.get_body_calculator(solys, library, logger, altitude, kernels_path)
-        autohelper.check_time_solys(solys, logger)
+        if owns_solys:
+            solys = solys2.Solys2(ip, port, password)
+        body_calc = autohelper.prepare_solys(solys, library, logger, altitude, kernels_path)
 
-        dt = datetime.datetime.now(datetime.timezone.utc)
+        dt = autohelper._utcnow()
         az, ze = body_calc.get_position(dt)
-        prev_az, prev_ze, _ = solys.get_current_position()
-        qsi, total_intens, _ = solys.get_sun_intensity()
-        az_offset = 180
-        if az > 180:
-            az_offset *= -1
+        (prev_az, prev_ze, _), (qsi, total_intens, _) = solys.get_position_and_intensity()
+        # 180 degrees away from the body, keeping the azimuth inside [0, 360]
+        az_offset = math.copysign(180, 180 - az)
         ze_offset = 45-ze
-        logger.info("Performing a lunar black of ({},{}) degrees. Connected with Solys2.".format(
-            az_offset, ze_offset))
-        autohelper.read_and_move(solys, body_calc, logger, (az_offset, ze_offset))
-        dt = datetime.datetime.now(datetime.timezone.utc)
-        prev_az, prev_ze, _ = solys.get_current_position()
-        qsi, total_intens, _ = solys.get_sun_intensity()
-        logger.info("UTC Datetime: {}".format(dt))
-        logger.info("Current Position: Azimuth: {}, Zenith: {}.".format(prev_az, prev_ze))
-        logger.info("Quadrants: {}. Total intensity: {}.".format(qsi, total_intens))
-        solys.close()
+        logger.info("Performing a lunar black of (%s,%s) degrees. Connected with Solys2.",
+            az_offset, ze_offset)
+        status = autohelper.read_and_move(solys, body_calc, logger, (az_offset, ze_offset))
+        if status == autohelper.MoveStatus.FATAL:
+            raise ConnectionError("Lost the connection with the Solys2.")
+        dt = autohelper._utcnow()
+        (prev_az, prev_ze, _), (qsi, total_intens, _) = solys.get_position_and_intensity()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("UTC Datetime: %s", dt)
+            logger.info("Current Position: Azimuth: %s, Zenith: %s.", prev_az, prev_ze)
+            logger.info("Quadrants: %s. Total intensity: %s.", qsi, total_intens)
+        if owns_solys:
+            solys.close()
         if is_finished:
             is_finished.value = True
         logger.info("Black finished and connection closed.")
     except Exception as e:
-        autohelper.exception_tracking(logger, e, solys, is_finished)
+        autohelper.exception_tracking(logger, e, solys, is_finished, owns_solys)
@@ -9,13 +9,20 @@ It exports the following functions:
 
 It exports the following classes:
     * ContainedBool: Dataclass that act as a container for bool type.
+    * StopSignal: Container for a "continue" bool that can be waited on until it's set to False.
+    * FinishedSignal: Container for a "finished" bool that can be waited on until it's set to True.
 """
 
 """___Built-In Modules___"""
 from dataclasses import dataclass
+import atexit
+import itertools
 import random
 import string
 import logging
+import logging.handlers
+import queue
+from threading import Event, Timer
 from typing import List
 
 """___Third-Party Modules___"""
@@ -37,13 +44,13 @@ SOLYS_DELAY_MARGIN = 2
 ASD_DELAY = 2
 MAX_SECS_DIFF_WARN = 2
 
-def gen_random_str(len: int) -> str:
+def gen_random_str(length: int) -> str:
     """
     Return a random str of the specified length.
 
     Parameters
     ----------
-    len : int
+    length : int
         Length of the desired str.
 
     Returns
@@ -51,7 +58,124 @@ def gen_random_str(len: int) -> str:
     rand_str : str
         Generated random str of the specified length.
     """
-    return ''.join(random.choice(string.ascii_letters) for i in range(len))
+    return ''.join(random.choices(string.ascii_letters, k=length))
+
+class _ListenerQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that passes the records to other handlers in a QueueListener thread.
+
+    Closing it stops the listener, after it has handled all the queued records, and closes
+    the other handlers.
+
+    Attributes
+    ----------
+    target_handlers : list of logging.Handler
+        Handlers that will handle the records in the listener thread.
+    listener : logging.handlers.QueueListener
+        Listener that handles the records. None once the handler is closed.
+    """
+    def __init__(self, handlers: List[logging.Handler]):
+        """
+        Parameters
+        ----------
+        handlers : list of logging.Handler
+            Handlers that will handle the records in the listener thread.
+        """
+        super().__init__(queue.Queue(-1))
+        self.target_handlers = handlers
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers,
+            respect_handler_level=True)
+        self.listener.start()
+        # Don't lose the queued records if the process ends without closing the logger
+        atexit.register(self.close)
+
+    def close(self):
+        self.acquire()
+        try:
+            listener = self.listener
+            self.listener = None
+        finally:
+            self.release()
+        if listener is not None:
+            atexit.unregister(self.close)
+            listener.stop()
+            for handler in self.target_handlers:
+                handler.close()
+        super().close()
+
+_LOG_FORMATTER = logging.Formatter('%(levelname)s:%(message)s')
+# Name of the logger shared by all the default loggers
+_DEFAULT_LOGGER_NAME = 'solys2'
+# Unique suffix for the names of the created file loggers
+_logger_seq = itertools.count()
+
+_LOG_BUFFER_CAPACITY = 256
+_LOG_FLUSH_SECS = 30
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that buffers the records of a FileHandler.
+
+    The buffer is written when it's full, when a WARNING or higher record arrives, at most
+    _LOG_FLUSH_SECS seconds after the oldest buffered record arrived, and when the handler
+    is closed. Closing it also closes the FileHandler.
+    """
+    def __init__(self, file_handler: logging.FileHandler):
+        """
+        Parameters
+        ----------
+        file_handler : logging.FileHandler
+            Handler that will write the buffered records.
+        """
+        super().__init__(_LOG_BUFFER_CAPACITY, logging.WARNING, file_handler)
+        # Writes the buffer if no other flush happens before, None if the buffer is empty
+        self._flush_timer: Timer = None
+
+    def emit(self, record: logging.LogRecord):
+        self.acquire()
+        try:
+            super().emit(record)
+            if self.buffer and self._flush_timer is None:
+                self._flush_timer = Timer(_LOG_FLUSH_SECS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        finally:
+            self.release()
+
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+
+    def close(self):
+        file_handler = self.target
+        super().close()
+        if file_handler is not None:
+            file_handler.close()
+
+_root_logging_initialized = False
+
+def _init_root_logging(level: int):
+    """
+    Configure the root logger with a stderr handler the first time it's called, and set
+    the level of the root handlers.
+
+    Parameters
+    ----------
+    level : int
+        Log level of the root handlers.
+    """
+    global _root_logging_initialized
+    if not _root_logging_initialized:
+        logging.basicConfig(level=logging.DEBUG)
+        _root_logging_initialized = True
+    for handler in logging.getLogger().handlers:
+        handler.setLevel(level)
 
 def create_default_logger(level: int = logging.WARNING) -> logging.Logger:
     """
@@ -59,6 +183,9 @@ def create_default_logger(level: int = logging.WARNING) -> logging.Logger:
 
     By default it will only log messages if they are level WARNING or higher.
 
+    It has no handlers of its own, it logs through the root logger, so the same logger is
+    returned every time instead of registering a new one.
+
     Parameters
     ----------
     level : int
@@ -69,12 +196,8 @@ def create_default_logger(level: int = logging.WARNING) -> logging.Logger:
     logger : logging.Logger
         Generated Logger.
     """
-    randstr = gen_random_str(20)
-    logging.basicConfig(level=logging.DEBUG)
-    for handler in logging.getLogger().handlers:
-        handler.setLevel(level)
-    logger = logging.getLogger('solys2-{}'.format(randstr))
-    return logger
+    _init_root_logging(level)
+    return logging.getLogger(_DEFAULT_LOGGER_NAME)
 
 def create_file_logger(logfile: str, extra_log_handlers: List[logging.Handler] = [],
     level: int = logging.DEBUG) -> logging.Logger:
@@ -96,22 +219,21 @@ def create_file_logger(logfile: str, extra_log_handlers: List[logging.Handler] =
     logger : logging.Logger
         Generated Logger.
     """
-    randstr = gen_random_str(20)
-    logging.basicConfig(level=logging.DEBUG)
-    for handler in logging.getLogger().handlers:
-        handler.setLevel(level)
-    logger = logging.getLogger('solys2-{}'.format(randstr))
-    for hand in extra_log_handlers:
-        logger.addHandler(hand)
+    suffix = next(_logger_seq)
+    _init_root_logging(level)
+    logger = logging.getLogger('solys2-{}'.format(suffix))
+    handlers = list(extra_log_handlers)
     if logfile != None and logfile != "":
         log_handler = logging.FileHandler(logfile, mode='a')
-        log_handler.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
-        logger.addHandler(log_handler)
+        log_handler.setFormatter(_LOG_FORMATTER)
+        handlers.append(_BufferedFileHandler(log_handler))
         logger.setLevel(logging.DEBUG)
-    else:
+    if handlers:
+        # The handlers are run in a listener thread, so the automation threads don't wait for
+        # the file writes.
+        logger.addHandler(_ListenerQueueHandler(handlers))
+    if logfile == None or logfile == "":
         logging.getLogger().setLevel(logging.DEBUG)
-        for handler in logging.getLogger().handlers:
-            handler.setLevel(level)
     return logger
 
 @dataclass
@@ -121,3 +243,99 @@ class ContainedBool:
     reference.
     """
     value : bool
+
+class StopSignal:
+    """
+    Container for a boolean variable that represents if an automatic process must continue,
+    like ContainedBool, but backed by a threading.Event so waits can be interrupted as soon
+    as it's set to False.
+
+    Attributes
+    ----------
+    value : bool
+        True while the process must continue. Setting it to False stops it.
+    """
+    def __init__(self, value: bool = True):
+        """
+        Parameters
+        ----------
+        value : bool
+            Initial value. By default True.
+        """
+        self._stop_event = Event()
+        self.value = value
+
+    @property
+    def value(self) -> bool:
+        return not self._stop_event.is_set()
+
+    @value.setter
+    def value(self, value: bool):
+        if value:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait until the value is set to False, or until the timeout expires.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds that will be waited.
+
+        Returns
+        -------
+        stopped : bool
+            True if the value is False, so the process must stop.
+        """
+        return self._stop_event.wait(timeout)
+
+class FinishedSignal:
+    """
+    Container for a boolean variable that represents if an automatic process has finished,
+    like ContainedBool, but backed by a threading.Event so it can be waited on instead of
+    polled.
+
+    Attributes
+    ----------
+    value : bool
+        False until the process has successfully finished, then True.
+    """
+    def __init__(self, value: bool = False):
+        """
+        Parameters
+        ----------
+        value : bool
+            Initial value. By default False.
+        """
+        self._finished_event = Event()
+        self.value = value
+
+    @property
+    def value(self) -> bool:
+        return self._finished_event.is_set()
+
+    @value.setter
+    def value(self, value: bool):
+        if value:
+            self._finished_event.set()
+        else:
+            self._finished_event.clear()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until the value is set to True, or until the timeout expires.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds that will be waited. If None it waits indefinitely.
+
+        Returns
+        -------
+        finished : bool
+            True if the value is True, so the process has finished.
+        """
+        return self._finished_event.wait(timeout)
@@ -9,8 +9,9 @@ from the Solys2.
 """
 
 """___Built-In Modules___"""
+import select
 import socket
-import time
+from typing import List
 
 """___Third-Party Modules___"""
 # import here
@@ -28,8 +29,12 @@ __status__ = "Development"
 
 _RECV_BUFFER_SIZE = 1024
 _SECS_TIMEOUT = 10
+# Seconds waited for more discarded data after receiving some in empty_recv
+_EMPTY_RECV_WAIT = 0.1
+# Seconds waited for the rest of a line received only partially
+_SPLIT_LINE_WAIT = 0.1
 
-def _send_command(s: socket.socket, command: str) -> str:
+def _send_command(s: socket.socket, command: str, wait_line_end: bool = False) -> str:
     """
     Sends the command through the given socket, and receives the response.
 
@@ -40,6 +45,8 @@ def _send_command(s: socket.socket, command: str) -> str:
         the respons from.
     command : str
         Command that will be sent to the Solys2.
+    wait_line_end : bool
+        Passed to _recv. True if the Solys2 ends its responses with a newline.
 
     Returns
     -------
@@ -47,25 +54,59 @@ def _send_command(s: socket.socket, command: str) -> str:
         Immediate response given by the Solys2.
     """
     s.sendall(bytes(command + "\n", "utf-8"))
-    rec = str(s.recv(_RECV_BUFFER_SIZE), "utf-8")
-    return rec
+    return _recv(s, wait_line_end)
 
-def _recv(s: socket.socket) -> str:
+def _send_commands(s: socket.socket, commands: List[str], wait_line_end: bool = False) -> str:
     """
-    Receives a message from the given socket.
+    Sends all the commands through the given socket at once, and receives the first response.
+
+    Parameters
+    ----------
+    s : socket.socket
+        Socket that will be used to send the messages through, and receive
+        the response from.
+    commands : list of str
+        Commands that will be sent to the Solys2.
+    wait_line_end : bool
+        Passed to _recv. True if the Solys2 ends its responses with a newline.
+
+    Returns
+    -------
+    response : str
+        Immediate response given by the Solys2.
+    """
+    s.sendall(bytes("".join(command + "\n" for command in commands), "utf-8"))
+    return _recv(s, wait_line_end)
+
+def _recv(s: socket.socket, wait_line_end: bool = False) -> str:
+    """
+    Receives a message from the given socket. If the message ends in the middle of a line,
+    the rest of the line is also received if it arrives shortly after, so a response split
+    in several packets isn't parsed in pieces.
+
+    A message is known to end in the middle of a line if it contains a newline but it doesn't
+    end with one, or if it doesn't end with a newline and wait_line_end is True.
 
     Parameters
     ----------
     s : socket.socket
         Socket that will be used to receive the respons from.
+    wait_line_end : bool
+        True if the Solys2 ends its responses with a newline. By default False.
 
     Returns
     -------
     response : str
         Response given by the Solys2.
     """
-    rec = str(s.recv(_RECV_BUFFER_SIZE), "utf-8")
-    return rec
+    rec = s.recv(_RECV_BUFFER_SIZE)
+    while rec and not rec.endswith(b"\n") and (wait_line_end or b"\n" in rec) and \
+        select.select([s], [], [], _SPLIT_LINE_WAIT)[0]:
+        more = s.recv(_RECV_BUFFER_SIZE)
+        if not more:
+            break
+        rec += more
+    return str(rec, "utf-8")
 
 class SolysConnection:
     """SolysConnection
@@ -75,6 +116,9 @@ class SolysConnection:
     ----------
     sock : socket.socket
         Socket that will be connected to the Solys2.
+    lines_end : bool
+        True once a response ended with a newline was received, so the Solys2 is known to end
+        its responses with one.
     """
 
     def __init__(self, ip: str, port: int):
@@ -100,9 +144,37 @@ class SolysConnection:
             Connection port of the Solys2.
         """
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Commands are small, they must be sent immediately instead of waiting to be coalesced
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Detect dead connections during the long waits between tracking movements
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            # Drop the connection if sent data stays unacknowledged, instead of retransmitting
+            # for minutes (only available on Linux)
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, _SECS_TIMEOUT * 1000)
         s.settimeout(_SECS_TIMEOUT)
         s.connect((ip, port))
         self.sock = s
+        self.lines_end = False
+
+    def _check_line_end(self, msg: str) -> str:
+        """
+        Remember if the Solys2 ends its responses with a newline, so the messages received
+        without one are known to be incomplete.
+
+        Parameters
+        ----------
+        msg : str
+            Message received from the Solys2.
+
+        Returns
+        -------
+        msg : str
+            The same message.
+        """
+        if msg.endswith("\n"):
+            self.lines_end = True
+        return msg
 
     def send_cmd(self, command: str) -> str:
         """
@@ -118,33 +190,59 @@ class SolysConnection:
         response : str
             Immediate response given by the Solys2.
         """
-        return _send_command(self.sock, command)
+        return self._check_line_end(_send_command(self.sock, command, self.lines_end))
+
+    def send_cmds(self, commands: List[str]) -> str:
+        """
+        Send several commands to the Solys2 at once, without waiting for each response.
+
+        Parameters
+        ----------
+        commands : list of str
+            Commands that will be sent to the Solys2.
+
+        Returns
+        -------
+        response : str
+            Immediate response given by the Solys2.
+        """
+        return self._check_line_end(_send_commands(self.sock, commands, self.lines_end))
 
-    def recv_msg(self) -> str:
+    def recv_msg(self, timeout: float = None) -> str:
         """
         Receives a message from the Solys2.
 
+        Parameters
+        ----------
+        timeout : float
+            Maximum amount of seconds waited for the message. If it expires an empty str is
+            returned. By default None, it waits up to the socket timeout, raising an error.
+
         Returns
         -------
         response : str
             Response given by the Solys2.
         """
-        return _recv(self.sock)
+        if timeout is not None and not select.select([self.sock], [], [], timeout)[0]:
+            return ""
+        return self._check_line_end(_recv(self.sock, self.lines_end))
 
     def empty_recv(self):
         """
         Receives messages from the Solys2 until there are no more messages.
         Those messages are descarted.
         """
-        msg = "a"
-        self.sock.setblocking(False)
-        while msg != None and len(msg) > 0:
+        # select is used instead of toggling the blocking mode, which would remove the timeout.
+        # If there was a message, wait a little for the rest of it.
+        wait = 0
+        while select.select([self.sock], [], [], wait)[0]:
             try:
                 msg = self.recv_msg()
-                time.sleep(0.1)
-            except:
+            except (OSError, UnicodeDecodeError):
+                break
+            if len(msg) == 0:
                 break
-        self.sock.setblocking(True)
+            wait = _EMPTY_RECV_WAIT
 
     def close(self) -> None:
         """
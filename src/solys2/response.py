@@ -38,6 +38,13 @@ __maintainer__ = "Javier Gatón Herguedas"
 __email__ = "gaton@goa.uva.es"
 __status__ = "Development"
 
+# Characters of a response that can be part of its numbers
+_NUM_CHARS = frozenset("0123456789.- ")
+_HEX_NUM_CHARS = _NUM_CHARS.union("ABCDEFabcdef")
+# Characters of a response that can't be part of its numbers, which are removed
+_NON_NUM_CHARS_RE = re.compile(r'[^\d.\ \-E]|E(?!-)')
+_NON_HEX_NUM_CHARS_RE = re.compile(r'[^\dA-Fa-f.\ \-]')
+
 ERROR_CODES = {
     '1': 'framing error.',
     '2': 'reserved for future use.',
@@ -152,9 +159,17 @@ def process_response(s: str, cmd: str, hex_nums: bool = False) -> Tuple[List[flo
     err_code = None
     if rstrip.startswith(cmd[:2]):
         # If the response starts with the command, it is answering that command
-        temp = re.sub(cmd, '', rstrip)
-        unwateted = re.sub('(\d|\.|\ |\-|E\-)', '', temp)
-        only_nums = re.sub(unwateted, '', temp)
+        if rstrip.startswith(cmd):
+            temp = rstrip[len(cmd):]
+        else:
+            temp = rstrip
+        if (_HEX_NUM_CHARS if hex_nums else _NUM_CHARS).issuperset(temp):
+            # Usual case, there is nothing to remove
+            only_nums = temp
+        elif hex_nums:
+            only_nums = _NON_HEX_NUM_CHARS_RE.sub('', temp)
+        else:
+            only_nums = _NON_NUM_CHARS_RE.sub('', temp)
         if len(only_nums) > 0:
             only_nums_split = only_nums.split()
             try:
@@ -45,6 +45,9 @@ _MAX_RELOGIN_RECURSION = 3
 _DEFAULT_VAL_ERR = -999
 
 _NONES_UNTIL_RECONNECT = 100
+# Seconds waited for the rest of the responses of the commands sent at once
+_PIPELINE_WAIT = 0.5
+_UTC = datetime.timezone.utc
 
 @dataclass
 class CommandOutput:
@@ -154,6 +157,7 @@ class Solys2:
         self.port = port
         self.password = password
         self.closed = True
+        self._pipelining = True
 
         self.connect()
         self.send_password()
@@ -237,6 +241,71 @@ class Solys2:
             err = ""
         return CommandOutput(str_out, nums, out, err)
 
+    def send_commands(self, cmds: List[str]) -> List[CommandOutput]:
+        """
+        Send several commands to the solys at once, and then receive their responses, so
+        the solys doesn't wait for the next command after answering each one.
+
+        The responses are matched to the commands in order. If their number doesn't match
+        the number of commands, or one of them doesn't answer its command, all the commands
+        are sent again one by one with send_command. If one of them is an error, it and the
+        remaining commands are sent again one by one, as send_command handles the errors.
+        The commands sent should be safe to repeat.
+
+        The commands are only sent at once when the connection has already received a
+        response ended with a newline, as otherwise the responses couldn't be told apart.
+        Until then they are sent one by one with send_command. If the Solys2 doesn't answer
+        all the commands within _PIPELINE_WAIT seconds, it's considered unable to receive
+        several commands at once, and the following calls send them one by one.
+
+        Parameters
+        ----------
+        cmds : list of str
+            Commands that are going to be sent.
+
+        Raises
+        ------
+        SolysException
+            If an error happens when calling the Solys2.
+
+        Returns
+        -------
+        outputs : list of CommandOutput
+            Output of each command, data received from solys, in the same order as cmds.
+        """
+        cmds = [cmd.strip() for cmd in cmds]
+        if len(cmds) <= 1 or not self._pipelining or not self.connection.lines_end:
+            return [self.send_command(cmd) for cmd in cmds]
+        self.connection.empty_recv()
+        try:
+            str_out = self.connection.send_cmds(cmds)
+        except (ConnectionResetError, BrokenPipeError):
+            self.connect()
+            str_out = self.connection.send_cmds(cmds)
+        # Only the lines ended by a newline are complete, the rest might still be arriving
+        lines = [line for line in str_out.split("\n")[:-1] if line.strip()]
+        while len(lines) < len(cmds):
+            more = self.connection.recv_msg(_PIPELINE_WAIT)
+            if len(more) == 0:
+                break
+            str_out += more
+            lines = [line for line in str_out.split("\n")[:-1] if line.strip()]
+        if len(lines) != len(cmds):
+            if len(lines) < len(cmds):
+                self._pipelining = False
+            return [self.send_command(cmd) for cmd in cmds]
+        outputs: List[CommandOutput] = []
+        for line, cmd in zip(lines, cmds):
+            nums, out, err = response.process_response(line, cmd)
+            if out == response.OutCode.NONE or not _answers_command(line, cmd):
+                # The responses don't line up with the commands
+                return [self.send_command(cmd) for cmd in cmds]
+            if out == response.OutCode.ERROR:
+                # All the responses have already been received, nothing else is pending
+                return outputs + [self.send_command(cmd) for cmd in cmds[len(outputs):]]
+            outputs.append(CommandOutput(line, nums, out, ""))
+        return outputs
+
     def send_password(self, recursion: int = 0) -> CommandOutput:
         """Change password (PW)
         Send the password to the solys, authenticating this connection.
@@ -314,6 +383,27 @@ class Solys2:
         """
         cmd = 'AD'
         output = self.send_command(cmd)
+        return self._adjustment_from_output(output)
+
+    def _adjustment_from_output(self, output: CommandOutput) -> Tuple[float, float, CommandOutput]:
+        """
+        Obtain the tracking adjustments from the output of the AD command, and update the
+        inner variables that store the current adjustments.
+
+        Parameters
+        ----------
+        output : CommandOutput
+            Output of the AD command.
+
+        Returns
+        -------
+        adjustment_0 : float
+            Degrees of adjustment of the first motor.
+        adjustment_1 : float
+            Degrees of adjustment of the second motor.
+        output : CommandOutput
+            Output of the command, data received from solys.
+        """
         req_nums_len = 2
         if output.out != response.OutCode.ANSWERED or len(output.nums) < req_nums_len:
             return _DEFAULT_VAL_ERR, _DEFAULT_VAL_ERR, output
@@ -494,7 +584,7 @@ class Solys2:
         output : CommandOutput
             Output of the command, data received from solys.
         """
-        output = self.send_command("PO 0 {}".format(azimuth%360))
+        output = self.send_command(_azimuth_command(azimuth))
         return output
 
     def set_zenith(self, zenith: float) -> CommandOutput:
@@ -517,11 +607,38 @@ class Solys2:
         output : CommandOutput
             Output of the command, data received from solys.
         """
-        zenith = abs(zenith)
-        if zenith > 90:
-            zenith = 90
-        output = self.send_command("PO 1 {}".format(zenith))
+        output = self.send_command(_zenith_command(zenith))
         return output
+
+    def set_position(self, azimuth: float, zenith: float) -> Tuple[CommandOutput, CommandOutput]:
+        """Position 0 (PO 0) and Position 1 (PO 1)
+        Set the azimuth and zenith angles at which the solys is pointing, sending both commands
+        at once.
+
+        Raises
+        ------
+        SolysException
+            If an error happens when calling the Solys2.
+
+        Parameters
+        ----------
+        azimuth : float
+            Float between 0 and 360, representing the azimuth at which we want the solys to
+            point to.
+        zenith : float
+            Float between 0 and 90, representing the zenith at which we want the solys to
+            point to.
+
+        Returns
+        -------
+        output_azimuth : CommandOutput
+            Output of the azimuth command, like set_azimuth.
+        output_zenith : CommandOutput
+            Output of the zenith command, like set_zenith.
+        """
+        output_az, output_ze = self.send_commands([_azimuth_command(azimuth),
+            _zenith_command(zenith)])
+        return output_az, output_ze
     
     def point_down(self) -> CommandOutput:
         """Point down as much as possible
@@ -583,10 +700,7 @@ class Solys2:
             Output of the command, data received from solys.
         """
         output = self.send_command("CP")
-        req_nums_len = 2
-        if output.out != response.OutCode.ANSWERED or len(output.nums) < req_nums_len:
-            return _DEFAULT_VAL_ERR, _DEFAULT_VAL_ERR, output
-        return output.nums[0], output.nums[1], output
+        return _current_position_from_output(output)
 
     def get_location_pressure(self) -> Tuple[float, float, float, CommandOutput]:
         """Location and pressure (LL)
@@ -752,15 +866,52 @@ class Solys2:
             Output of the command, data received from solys.
         """
         output = self.send_command("SI")
-        intensities = []
-        total_intensity = 0
-        req_nums_len = 5
-        if output.out != response.OutCode.ANSWERED or len(output.nums) < req_nums_len:
-            return [_DEFAULT_VAL_ERR for _ in range(4)], _DEFAULT_VAL_ERR, output
-        intensities = output.nums[:4]
-        total_intensity = output.nums[4]
-        return intensities, total_intensity, output
+        return _sun_intensity_from_output(output)
+
+    def get_position_and_intensity(self) -> Tuple[Tuple[float, float, CommandOutput],
+        Tuple[List[float], float, CommandOutput]]:
+        """Current Position (CP) and Sun intensity (SI)
+        Obtain the current position and the current sun intensity, sending both commands
+        at once.
+
+        Raises
+        ------
+        SolysException
+            If an error happens when calling the Solys2.
+
+        Returns
+        -------
+        position : tuple of (float, float, CommandOutput)
+            Azimuth, zenith and output, like get_current_position.
+        intensity : tuple of (list of 4 float, float, CommandOutput)
+            Intensities, total intensity and output, like get_sun_intensity.
+        """
+        output_cp, output_si = self.send_commands(["CP", "SI"])
+        return _current_position_from_output(output_cp), _sun_intensity_from_output(output_si)
     
+    def get_position_and_adjustment(self) -> Tuple[Tuple[float, float, CommandOutput],
+        Tuple[float, float, CommandOutput]]:
+        """Current Position (CP) and Adjust (AD)
+        Obtain the current position and the tracking adjustment of the motors, sending both
+        commands at once.
+
+        Also updates the inner variables that store the current adjustments.
+
+        Raises
+        ------
+        SolysException
+            If an error happens when calling the Solys2.
+
+        Returns
+        -------
+        position : tuple of (float, float, CommandOutput)
+            Azimuth, zenith and output, like get_current_position.
+        adjustment : tuple of (float, float, CommandOutput)
+            Adjustment of both motors and output, like adjust.
+        """
+        output_cp, output_ad = self.send_commands(["CP", "AD"])
+        return _current_position_from_output(output_cp), self._adjustment_from_output(output_ad)
+
     def get_raw_status(self) -> Tuple[str, CommandOutput]:
         """Status (IS)
         Get the raw status code returned from the Solys2
@@ -888,16 +1039,16 @@ class Solys2:
         output : CommandOutput
             Output of the command, data received from solys.
         """
-        t0 = time.time()
+        t0 = time.monotonic()
         output = self.send_command("TI")
         nums = output.nums
         if len(nums) != 5:
-            dt = datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+            dt = datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=_UTC)
             return dt, output
-        tf = time.time()
+        tf = time.monotonic()
         t_extra = (tf-t0)/2
         dt = datetime.datetime(int(nums[0]), 1, 1, int(nums[2]), int(nums[3]), int(nums[4]),
-            tzinfo=datetime.timezone.utc) + datetime.timedelta(int(nums[1])-1, t_extra)
+            tzinfo=_UTC) + datetime.timedelta(int(nums[1])-1, t_extra)
         return dt, output
     
     def calculate_timedelta(self) -> Tuple[datetime.timedelta, CommandOutput]:
@@ -918,9 +1069,113 @@ class Solys2:
             Output of the command, data received from solys.
         """
         solys_dt, out = self.get_datetime()
-        pc_dt = datetime.datetime.now(datetime.timezone.utc)
+        pc_dt = datetime.datetime.now(_UTC)
         return (solys_dt - pc_dt), out
 
+def _azimuth_command(azimuth: float) -> str:
+    """
+    Command that sets the azimuth (PO 0), normalized to [0, 360).
+
+    Parameters
+    ----------
+    azimuth : float
+        Azimuth at which the solys will point to.
+
+    Returns
+    -------
+    cmd : str
+        Command for the Solys2.
+    """
+    return "PO 0 {}".format(azimuth%360)
+
+def _zenith_command(zenith: float) -> str:
+    """
+    Command that sets the zenith (PO 1), limited to [0, 90].
+
+    Parameters
+    ----------
+    zenith : float
+        Zenith at which the solys will point to.
+
+    Returns
+    -------
+    cmd : str
+        Command for the Solys2.
+    """
+    zenith = abs(zenith)
+    if zenith > 90:
+        zenith = 90
+    return "PO 1 {}".format(zenith)
+
+def _answers_command(line: str, cmd: str) -> bool:
+    """
+    Check that a response, already known to start like the command, isn't the response of
+    another command with the same name but a different first parameter, like PO 0 and PO 1.
+
+    Parameters
+    ----------
+    line : str
+        Response given by the Solys2.
+    cmd : str
+        Command sent to the Solys2.
+
+    Returns
+    -------
+    answers : bool
+        False if both have a first parameter and it's different.
+    """
+    cmd_words = cmd.split()
+    line_words = line.split()
+    if len(cmd_words) < 2 or len(line_words) < 2:
+        return True
+    return cmd_words[1] == line_words[1]
+
+def _current_position_from_output(output: CommandOutput) -> Tuple[float, float, CommandOutput]:
+    """
+    Obtain the current position from the output of the CP command.
+
+    Parameters
+    ----------
+    output : CommandOutput
+        Output of the CP command.
+
+    Returns
+    -------
+    azimuth : float
+        Azimuth angle at which the Solys is pointing.
+    zenith : float
+        Zenith angle at which the Solys is pointing.
+    output : CommandOutput
+        Output of the command, data received from solys.
+    """
+    req_nums_len = 2
+    if output.out != response.OutCode.ANSWERED or len(output.nums) < req_nums_len:
+        return _DEFAULT_VAL_ERR, _DEFAULT_VAL_ERR, output
+    return output.nums[0], output.nums[1], output
+
+def _sun_intensity_from_output(output: CommandOutput) -> Tuple[List[float], float, CommandOutput]:
+    """
+    Obtain the sun intensities from the output of the SI command.
+
+    Parameters
+    ----------
+    output : CommandOutput
+        Output of the SI command.
+
+    Returns
+    -------
+    intensities : list of 4 float
+        Intensity of each quadrant. [Q1, Q2, Q3, Q4]
+    total_intensity : float
+        Total intensity.
+    output : CommandOutput
+        Output of the command, data received from solys.
+    """
+    req_nums_len = 5
+    if output.out != response.OutCode.ANSWERED or len(output.nums) < req_nums_len:
+        return [_DEFAULT_VAL_ERR for _ in range(4)], _DEFAULT_VAL_ERR, output
+    return output.nums[:4], output.nums[4], output
+
 def translate_error(code: str) -> str:
     """
     Returns the error related to the error code
@@ -18,12 +18,45 @@ last_po_time = None
 
 DELAY = 5
 
-def server_thread(conn: socket.socket):
+def answer(line: str) -> str:
     global current_azimuth
     global current_zenith
     global azimuth_adj
     global zenith_adj
     global last_po_time
+    cmd = line[:2]
+    if cmd == "TI":
+        ret = "TI 2022 93 15 15 15"
+    elif cmd == "PO":
+        last_po_time = time.time()
+        vals = line.split()
+        if int(vals[1]) == 0:
+            current_azimuth = float(vals[2])
+        else:
+            current_zenith = float(vals[2])
+        ret = "PO"
+    elif cmd == "CP":
+        current_po_time = time.time()
+        if last_po_time == None or last_po_time + DELAY <= current_po_time:
+            ret = "CP {} {}".format(current_azimuth+azimuth_adj, current_zenith+zenith_adj)
+        else:
+            ret = "CP {} {}".format(current_azimuth+azimuth_adj+1, current_zenith+zenith_adj+1)
+    elif cmd == "AD":
+        vals = line.split()
+        if len(vals) <= 1:
+            ret = "AD {} {}".format(azimuth_adj, zenith_adj)
+        else:
+            print(vals)
+            if int(vals[1]) == 0:
+                azimuth_adj += float(vals[2])
+            else:
+                zenith_adj += float(vals[2])
+            ret = "AD"
+    else:
+        ret = "{} 1 1 1 1 1 1 1 1 1 1 1".format(cmd)
+    return ret
+
+def server_thread(conn: socket.socket):
     print("new connection")
     empties = 0
     while True:
@@ -33,38 +66,14 @@ def server_thread(conn: socket.socket):
         if data:
             empties = 0
             print(data)
-            cmd = str(data)[2:4]
-            if cmd == "TI":
-                ret = "TI 2022 93 15 15 15"
-            elif cmd == "PO":
-                last_po_time = time.time()
-                vals = str(data)[2:-3].split()
-                if int(vals[1]) == 0:
-                    current_azimuth = float(vals[2])
-                else:
-                    current_zenith = float(vals[2])
-                ret = "PO"
-            elif cmd == "CP":
-                current_po_time = time.time()
-                if last_po_time == None or last_po_time + DELAY <= current_po_time:
-                    ret = "CP {} {}".format(current_azimuth+azimuth_adj, current_zenith+zenith_adj)
-                else:
-                    ret = "CP {} {}".format(current_azimuth+azimuth_adj+1, current_zenith+zenith_adj+1)
-            elif cmd == "AD":
-                vals = str(data)[2:-3].split()
-                if len(vals) <= 1:
-                    ret = "AD {} {}".format(azimuth_adj, zenith_adj)
-                else:
-                    print(vals)
-                    if int(vals[1]) == 0:
-                        azimuth_adj += float(vals[2])
-                    else:
-                        zenith_adj += float(vals[2])
-                    ret = "AD"
-            else:
-                ret = "{} 1 1 1 1 1 1 1 1 1 1 1".format(cmd)
-            print(ret)
-            conn.sendall(bytes(ret, "utf-8"))
+            # Several commands might arrive in the same message
+            for line in str(data, "utf-8").splitlines():
+                line = line.strip()
+                if line:
+                    ret = answer(line)
+                    print(ret)
+                    # The Solys2 ends each response with a CRLF
+                    conn.sendall(bytes(ret + "\r\n", "utf-8"))
         else:
             empties += 1
         time.sleep(0.1)